@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Benchmarks — How generate_docs.py scales with ship history.
+
+Generates deterministic synthetic SHIPLOGs (1k → 1M items), then times each
+stage of the generator separately: full parse, checkpointed tail parse,
+building the ShipStore indexes, every registered page renderer and the
+page writes.
+
+Before timing anything, the parser's output is checked against
+reference_parse() — the original line-by-line parser, frozen in
+test_shiplog_parity.py — on every synthetic log and on PARITY_CASES (CRLF, stray `**`, malformed and
+bare `SHIPPED` tags, …), both from scratch and resumed from a checkpoint.
+
+Run:  python3 scripts/bench_docs.py             # compare against baseline
+      python3 scripts/bench_docs.py --save      # record a new baseline
+      python3 scripts/bench_docs.py --sizes 1000 10000
+
+Exits 1 if any stage is slower than baseline by more than --tolerance.
+"""
+
+import sys
+import json
+import random
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import generate_docs as gen
+from test_shiplog_parity import PARITY_CASES, line_ends, reference_parse
+
+BASELINE = Path.home() / ".mirrordna" / "bench" / "doc_bench_baseline.json"
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Stages faster than this are pure noise — never flag them as regressions.
+NOISE_FLOOR_MS = 5.0
+
+# Real section names (so renderers hit their categories) plus filler systems.
+REAL_SECTIONS = [
+    'Kavach', 'Kavach / Chetana', 'MirrorSwarm Orchestration Engine', 'Intelligence',
+    'Continuity System (this file)', 'Vault Organization', 'ActiveMirror Site', 'ActiveMirrorOS',
+    'Factory Trigger', 'Dashboard', 'Infrastructure', 'MirrorDNA Infrastructure',
+    'MirrorPublish', 'Beacon Auto-Publish', 'MirrorRadar', 'Sovereign Factory',
+]
+WORDS = ('sovereign mirror vault guard scan shield swarm beacon kernel ledger pulse '
+         'deepfake voice clone qr sms audit snapshot dns heal router twin memory '
+         'consent lineage relay mesh graph publish radar factory agent').split()
+
+
+# ─── Synthetic SHIPLOG ────────────────────────────────────────────────────────
+
+def synthetic_shiplog(n_items, seed=42):
+    """Deterministic SHIPLOG text with n_items items across many sections."""
+    rng = random.Random(seed)
+    n_sections = max(len(REAL_SECTIONS), n_items // 40)
+    names = REAL_SECTIONS + [f'System {i:05d}' for i in range(n_sections - len(REAL_SECTIONS))]
+    start, days = date(2025, 4, 1), 400
+
+    lines = ['# SHIPLOG', '', 'Append-only record of shipped capabilities.', '']
+    item = 0
+    while item < n_items:
+        lines.append(f'## {rng.choice(names)}')
+        if rng.random() < 0.6:
+            lines.append(f'> Module: `~/repos/{rng.choice(WORDS)}-{item}`')
+        lines.append('')
+        for _ in range(min(rng.randint(5, 60), n_items - item)):
+            day = (start + timedelta(days=item * days // n_items)).isoformat()
+            name = ' '.join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+            desc = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 18)))
+            sep = rng.choice(['—', '—', ':'])
+            paren = f' ({rng.choice(WORDS)})' if rng.random() < 0.1 else ''
+            roll = rng.random()
+            if roll < 0.7:
+                lines.append(f'- **{name}**{paren} {sep} {desc} `SHIPPED {day}`')
+            elif roll < 0.9:
+                lines.append(f'- **{name}**{paren} {sep} {desc}')
+                lines.append(f'- Location: `~/repos/{rng.choice(WORDS)}`')
+                lines.append(f'- SHIPPED: {day}')
+            else:
+                lines.append(f'- **{name}** {sep} {desc}')
+                lines.append(f'- Spec: {rng.choice(WORDS)}.md')
+            item += 1
+        lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+# ─── Parity ───────────────────────────────────────────────────────────────────
+
+def check_parity(workdir):
+    """Compare the generator's parser with reference_parse() on every
+    PARITY_CASES input, full and resumed from a checkpoint at every line.
+    Returns the names of the cases that differ (pytest runs the same
+    checks, case by case, from test_shiplog_parity.py)."""
+    failed = []
+    for name, text in PARITY_CASES.items():
+        shiplog = workdir / f'parity-{name}.md'
+        shiplog.write_bytes(text.encode())
+        expected = reference_parse(shiplog.read_text())
+        ok = dict(gen.parse_shiplog(shiplog, None)) == expected
+        data = text.encode()
+        for cut in line_ends(data):
+            checkpoint = workdir / f'parity-{name}.json'
+            checkpoint.unlink(missing_ok=True)
+            shiplog.write_bytes(data[:cut])
+            gen.parse_shiplog(shiplog, checkpoint)
+            shiplog.write_bytes(data)
+            ok = ok and dict(gen.parse_shiplog(shiplog, checkpoint)) == expected
+        if not ok:
+            failed.append(name)
+    return failed
+
+
+# ─── Timing ───────────────────────────────────────────────────────────────────
+
+def best_of(fn, repeat):
+    """Minimum wall time in ms over `repeat` runs, plus the last result."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best, result
+
+
+def bench_size(n_items, workdir, repeat):
+    shiplog = workdir / f'SHIPLOG-{n_items}.md'
+    text = synthetic_shiplog(n_items)
+    shiplog.write_text(text)
+    timings = {}
+
+    timings['parse_shiplog'], sections = best_of(lambda: gen.parse_shiplog(shiplog, None), repeat)
+    if sections != reference_parse(text):
+        raise SystemExit(f'  ERROR: parse differs from the reference parser at {n_items} items')
+
+    # Tail parse: checkpoint at ~99% of the file, then parse the last 1%
+    checkpoint = workdir / f'checkpoint-{n_items}.json'
+    cut = text.rfind('\n## ', 0, len(text) * 99 // 100) + 1
+    shiplog.write_text(text[:cut])
+    gen.parse_shiplog(shiplog, checkpoint)
+    shiplog.write_text(text)
+    state = checkpoint.read_bytes()
+
+    def tail():
+        checkpoint.write_bytes(state)
+        return gen.parse_shiplog(shiplog, checkpoint)
+    timings['parse_shiplog_tail'], tail_sections = best_of(tail, repeat)
+    if tail_sections != sections:
+        raise SystemExit(f'  ERROR: checkpointed parse differs from full parse at {n_items} items')
+
+    timings['ship_store'], store = best_of(lambda: gen.ShipStore(sections), repeat)
+
+    rendered = {}
+    for page in gen.all_pages(store):
+        ms, (html, _) = best_of(lambda: page.render(store), repeat)
+        timings[f'render:{page.name}'] = ms
+        rendered[page.output] = html
+
+    def write_all():
+        out = Path(tempfile.mkdtemp(dir=workdir))
+        for output, html in rendered.items():
+            gen.write_page(output, html, out)
+    timings['write_pages'], _ = best_of(write_all, repeat)
+
+    return {
+        'items': store.total,
+        'sections': len(sections),
+        'lines': text.count('\n'),
+        'bytes': len(text.encode()),
+        'ms': {k: round(v, 3) for k, v in timings.items()},
+    }
+
+
+# ─── Baseline ─────────────────────────────────────────────────────────────────
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for size, res in results.items():
+        base = baseline.get(size, {}).get('ms', {})
+        for stage, ms in res['ms'].items():
+            old = base.get(stage)
+            if old is None or max(ms, old) < NOISE_FLOOR_MS:
+                continue
+            if ms > old * (1 + tolerance):
+                regressions.append(f'{size} items · {stage}: {old:.1f} → {ms:.1f} ms (+{(ms / old - 1) * 100:.0f}%)')
+    return regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark generate_docs.py on synthetic SHIPLOGs')
+    ap.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='item counts to benchmark')
+    ap.add_argument('--repeat', type=int, default=3, help='runs per stage; the best is kept')
+    ap.add_argument('--save', action='store_true', help='store results as the new baseline')
+    ap.add_argument('--baseline', type=Path, default=BASELINE)
+    ap.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown vs baseline (0.25 = 25%%)')
+    args = ap.parse_args(argv)
+
+    print('⟡ MirrorDNA Doc Benchmarks')
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        failed = check_parity(Path(tmp))
+        if failed:
+            print(f'  ERROR: parse differs from the reference parser on: {", ".join(failed)}')
+            return 1
+        print(f'  Parity: {len(PARITY_CASES)} edge cases match the reference parser')
+        for n in args.sizes:
+            res = bench_size(n, Path(tmp), args.repeat)
+            results[str(n)] = res
+            print(f'\n  {n:,} items — {res["sections"]} sections, {res["lines"]:,} lines, {res["bytes"] / 1e6:.1f} MB')
+            for stage, ms in res['ms'].items():
+                print(f'    {stage:<28} {ms:>10.1f} ms')
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=1))
+        print(f'\n⟡ Baseline saved: {args.baseline}')
+        return 0
+
+    if not args.baseline.exists():
+        print(f'\n  No baseline at {args.baseline} — run with --save to record one')
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    if regressions:
+        print(f'\n  REGRESSIONS (>{args.tolerance:.0%} slower than baseline):')
+        for r in regressions:
+            print(f'    ✗ {r}')
+        return 1
+    print('\n⟡ No regressions vs baseline')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,6 +6,7 @@ set -e
 
 DOCS_DIR="$HOME/repos/MirrorDNA-Docs"
 SITE_DIR="$HOME/repos/activemirror-site"
+SCRIPTS_DIR="$(cd "$(dirname "$0")" && pwd)"
 TIMESTAMP=$(date +%Y-%m-%d)
 
 # Colors
@@ -23,6 +24,9 @@ echo "================================"
 scan_repos() {
     echo -e "\n${YELLOW}Scanning repositories...${NC}"
 
+    # All repos, concurrently; unchanged ones come from the scanner's cache
+    python3 "$SCRIPTS_DIR/doc_repos.py" scan
+
     # Check activemirror-site version
     if [ -f "$SITE_DIR/package.json" ]; then
         SITE_VERSION=$(grep '"version"' "$SITE_DIR/package.json" | head -1 | sed 's/.*"version": "\(.*\)".*/\1/')
@@ -87,9 +91,14 @@ deploy_docs() {
         return 0
     fi
 
-    # Commit and push
-    git add -A
-    git commit -m "⟡ Doc sync — $TIMESTAMP — via doc-sync.sh"
+    # Commit and push — under the generator's build lock, so a build that is
+    # committing its staged output is never picked up half-way
+    if command -v flock >/dev/null 2>&1; then
+        flock "$DOCS_DIR/.doc-build.lock" sh -c 'git add -A && git commit -m "$1"' _ "⟡ Doc sync — $TIMESTAMP — via doc-sync.sh"
+    else
+        git add -A
+        git commit -m "⟡ Doc sync — $TIMESTAMP — via doc-sync.sh"
+    fi
     git push origin main
 
     echo -e "\n${GREEN}✓ Deployed to GitHub Pages${NC}"
@@ -102,23 +111,8 @@ deploy_docs() {
 audit_readmes() {
     echo -e "\n${YELLOW}Auditing READMEs...${NC}"
 
-    for repo in "$HOME/repos"/*/; do
-        repo_name=$(basename "$repo")
-        readme="$repo/README.md"
-
-        if [ -f "$readme" ]; then
-            lines=$(wc -l < "$readme" | tr -d ' ')
-            last_modified=$(stat -f "%Sm" -t "%Y-%m-%d" "$readme" 2>/dev/null || echo "unknown")
-
-            if [ "$lines" -lt 10 ]; then
-                echo -e "  ${YELLOW}⚠${NC} $repo_name: $lines lines (sparse)"
-            else
-                echo -e "  ${GREEN}✓${NC} $repo_name: $lines lines"
-            fi
-        else
-            echo -e "  ${YELLOW}⚠${NC} $repo_name: No README"
-        fi
-    done
+    # Concurrent and cached per repo (HEAD + README mtime); works on Linux and macOS
+    python3 "$SCRIPTS_DIR/doc_repos.py" audit
 }
 
 # ─────────────────────────────────────
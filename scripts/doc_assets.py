@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Assets — Minified, fingerprinted, precompressed output.
+
+The asset stage around generate_docs.py's page build:
+
+    urls, results = fingerprint_assets(DOCS_DIR)     # before pages: styles.<hash>.css …
+    chunks = minify_html(chunks)                     # while pages stream to disk
+    results += precompress(DOCS_DIR, outputs, changed)   # after pages: .gz / .br
+
+Hashed names are content-addressed, so an unchanged stylesheet keeps its
+name, its HTML references and its compressed siblings — nothing is rebuilt.
+The hand-written pages keep linking the plain styles.css / favicon.svg,
+which stay in place as the sources.
+
+Brotli output needs the optional `brotli` package; without it only .gz
+siblings are written.
+"""
+
+import os
+import re
+import gzip
+import hashlib
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# HEAD field → source file under the docs root
+ASSETS = {'styles': 'styles.css', 'favicon': 'favicon.svg'}
+HASH_CHARS = 10
+
+CSS_MINIFY = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/|\s*([{};,>])\s*|\s+''', re.S)
+SVG_GAPS = re.compile(r'>\s+<')
+
+
+def _css_token(m):
+    if m.group(1):
+        return m.group(1)   # string literal, untouched
+    if m.group(2):
+        return m.group(2)   # punctuation, surrounding whitespace dropped
+    return '' if m.group(0).startswith('/*') else ' '
+
+
+def minify_css(text):
+    """Drop comments and collapse whitespace, leaving string literals alone."""
+    return CSS_MINIFY.sub(_css_token, text).strip()
+
+
+def minify_svg(text):
+    return SVG_GAPS.sub('><', text).strip()
+
+
+def minify_html(chunks):
+    """Streaming HTML minifier: strips indentation and blank lines.
+
+    Line breaks are kept, so inline scripts and running text mean exactly
+    what they did. Works chunk by chunk, holding at most one partial line.
+    """
+    tail = ''
+    sep = ''
+    for chunk in chunks:
+        lines = (tail + chunk).split('\n')
+        tail = lines.pop()
+        kept = [line.strip() for line in lines]
+        kept = '\n'.join(line for line in kept if line)
+        if kept:
+            yield sep + kept
+            sep = '\n'
+    tail = tail.strip()
+    if tail:
+        yield sep + tail
+
+
+MINIFIERS = {'.css': minify_css, '.svg': minify_svg}
+# Outputs GitHub Pages serves as-is; the Docusaurus markdown is not one of them
+COMPRESSIBLE = {'.html', '.json', '.css', '.svg', '.txt', '.xml'}
+SIBLINGS = ('.gz', '.br')   # every codec's extension, installed or not
+
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f'{stem}.{hashlib.sha256(data).hexdigest()[:HASH_CHARS]}{ext}'
+
+
+def hashed_glob(name):
+    """Glob pattern matching every fingerprinted copy of `name`."""
+    stem, ext = os.path.splitext(name)
+    return f'{stem}.{"[0-9a-f]" * HASH_CHARS}{ext}'
+
+
+def _stale(root, name, keep):
+    """Earlier fingerprinted copies of `name` (and their siblings)."""
+    stem, ext = os.path.splitext(name)
+    pattern = re.compile(rf'{re.escape(stem)}\.[0-9a-f]{{{HASH_CHARS}}}{re.escape(ext)}(\.gz|\.br)?')
+    return sorted(p.name for p in root.iterdir() if pattern.fullmatch(p.name) and not p.name.startswith(keep))
+
+
+def fingerprint_assets(root, staging=None):
+    """Write a minified, content-hashed copy of every asset.
+
+    New files go to `staging` when given (the caller commits them, and
+    deletes the superseded copies reported as 'removed'); otherwise they
+    are written, and stale copies deleted, in place.
+    Returns ({field: hashed name}, [(rel_path, status, summary)]) — status is
+    'written', 'unchanged' or 'removed' (a superseded fingerprint).
+    """
+    root = Path(root)
+    out = Path(staging) if staging else root
+    urls, changes = {}, []
+    for field, name in ASSETS.items():
+        src = root / name
+        if not src.exists():
+            urls[field] = name
+            continue
+        raw = src.read_bytes()
+        minify = MINIFIERS.get(src.suffix)
+        data = minify(raw.decode()).encode() if minify else raw
+        target = hashed_name(name, data)
+        urls[field] = target
+        if (root / target).exists():
+            changes.append((target, 'unchanged', f'{target} — current'))
+        else:
+            (out / target).write_bytes(data)
+            changes.append((target, 'written', f'{target} — {len(raw):,} → {len(data):,} bytes'))
+        for old in _stale(root, name, target):
+            if not staging:
+                (root / old).unlink()
+            changes.append((old, 'removed', f'{old} — superseded'))
+    return urls, changes
+
+
+def compressors():
+    """(extension, compress) for every available codec. Deterministic output."""
+    codecs = [('.gz', lambda data: gzip.compress(data, 9, mtime=0))]
+    if brotli is not None:
+        codecs.append(('.br', lambda data: brotli.compress(data, quality=11)))
+    return codecs
+
+
+def precompress(root, outputs, changed, staging=None):
+    """Write compressed siblings for `outputs` (paths under root) of the
+    COMPRESSIBLE types.
+
+    A sibling is (re)written only if its source is in `changed` or the
+    sibling is missing, so unchanged outputs cost one stat per codec. With
+    a `staging` directory, changed sources are read from it and siblings
+    are written into it.
+    Returns [(rel_path, raw_bytes, compressed_bytes)] for what was written.
+    """
+    root = Path(root)
+    codecs = compressors()
+    written = []
+    for rel in outputs:
+        if os.path.splitext(rel)[1] not in COMPRESSIBLE:
+            continue
+        live = root / rel
+        data = None
+        for ext, compress in codecs:
+            sibling = live.with_name(live.name + ext)
+            if rel not in changed and sibling.exists():
+                continue
+            if data is None:
+                src = Path(staging) / rel if staging and (Path(staging) / rel).exists() else live
+                if not src.exists():
+                    break
+                data = src.read_bytes()
+            packed = compress(data)
+            if staging:
+                dest = Path(staging) / f'{rel}{ext}'
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                dest.write_bytes(packed)
+            else:
+                tmp = sibling.with_name(f'.{sibling.name}.tmp')
+                tmp.write_bytes(packed)
+                os.replace(tmp, sibling)
+            written.append((f'{rel}{ext}', len(data), len(packed)))
+    return written
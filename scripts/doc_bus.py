@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Bus — Locked, rotating, indexed writer for the changelog bus.
+
+    bus = Bus()                                   # ~/.mirrordna/bus/changelog.jsonl
+    bus.append([event, ...])                      # one locked write per batch
+    with bus.batch() as emit:                     # or collect, then write once
+        emit(event)
+    bus.tail(20)                                  # last 20 events
+    bus.since('2026-02-01T00:00:00')              # events at or after a time
+    bus.last(lambda e: e['event'] == 'docs_updated')
+
+Layout, all next to the bus file:
+
+    changelog.jsonl          active segment (other agents may append here too)
+    changelog.000001.jsonl   rotated segments, oldest first
+    changelog.idx            fixed-width records: timestamp, segment, offset, length
+    changelog.lock           flock(2) target — stable across rotations
+
+Every record is the same size, so "last N" is one seek and "since T" is a
+binary search over the index; no read ever scans the log. Lines appended
+by writers that bypass this module are indexed the next time anyone takes
+the lock.
+"""
+
+import os
+import json
+import time
+import fcntl
+import struct
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+BUS_FILE = Path.home() / ".mirrordna" / "bus" / "changelog.jsonl"
+SEGMENT_BYTES = 8 * 1024 * 1024
+
+RECORD = struct.Struct('<dIQI')  # timestamp, segment, byte offset, byte length
+
+
+def _timestamp(event, default=None):
+    """Event time as epoch seconds (from its ISO 'timestamp' field)."""
+    try:
+        return datetime.fromisoformat(event['timestamp']).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return time.time() if default is None else default
+
+
+def _epoch(when):
+    if isinstance(when, (int, float)):
+        return float(when)
+    if isinstance(when, str):
+        when = datetime.fromisoformat(when)
+    return when.timestamp()
+
+
+class Bus:
+    """One JSONL bus: size-rotated segments plus a sidecar offset index."""
+
+    def __init__(self, path=BUS_FILE, max_bytes=SEGMENT_BYTES):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix('.idx')
+        self.lock_path = self.path.with_suffix('.lock')
+        self.max_bytes = max_bytes
+
+    # ─── Segments ──────────────────────────────────────────────────────────
+
+    def _segment(self, seq):
+        return self.path.with_name(f'{self.path.stem}.{seq:06d}{self.path.suffix}')
+
+    def _active_seq(self):
+        """Sequence number the active segment will get when it is rotated."""
+        seqs = [0]
+        for p in self.path.parent.glob(f'{self.path.stem}.*{self.path.suffix}'):
+            mid = p.name[len(self.path.stem) + 1:-len(self.path.suffix)]
+            if mid.isdigit():
+                seqs.append(int(mid))
+        return max(seqs) + 1
+
+    def _segment_path(self, seq, active):
+        return self.path if seq == active else self._segment(seq)
+
+    # ─── Index ─────────────────────────────────────────────────────────────
+
+    def __len__(self):
+        try:
+            return self.index_path.stat().st_size // RECORD.size
+        except OSError:
+            return 0
+
+    def _records(self, first, count):
+        if count <= 0:
+            return []
+        with open(self.index_path, 'rb') as f:
+            f.seek(first * RECORD.size)
+            data = f.read(count * RECORD.size)
+        usable = len(data) - len(data) % RECORD.size
+        return [RECORD.unpack_from(data, pos) for pos in range(0, usable, RECORD.size)]
+
+    def _scan(self, seq, path, start, ts):
+        """Index records for the complete lines of a segment from `start`."""
+        recs = []
+        with open(path, 'rb') as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    ts = _timestamp(json.loads(line), ts)
+                except ValueError:
+                    pass
+                recs.append(RECORD.pack(ts, seq, offset, len(line)))
+                offset += len(line)
+        return recs, ts
+
+    def _catch_up(self, active):
+        """Index lines written since the last indexed one (by anyone). Caller holds the lock."""
+        n = len(self)
+        last = self._records(n - 1, 1)[0] if n else None
+        seq, start, ts = (last[1], last[2] + last[3], last[0]) if last else (1, 0, 0.0)
+        recs = []
+        for s in range(seq, active + 1):
+            path = self._segment_path(s, active)
+            if path.exists():
+                more, ts = self._scan(s, path, start if s == seq else 0, ts)
+                recs += more
+        if recs:
+            with open(self.index_path, 'ab') as f:
+                f.write(b''.join(recs))
+
+    @contextmanager
+    def _locked(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                active = self._active_seq()
+                self._catch_up(active)
+                yield active
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def refresh(self):
+        """Bring the index up to date with lines appended by other writers."""
+        with self._locked():
+            pass
+
+    # ─── Write ─────────────────────────────────────────────────────────────
+
+    def append(self, events):
+        """Append events under one flock: one write to the log, one to the index."""
+        lines = [(json.dumps(e, ensure_ascii=False) + '\n').encode() for e in events]
+        if not lines:
+            return
+        data = b''.join(lines)
+        with self._locked() as active:
+            try:
+                size = self.path.stat().st_size
+            except OSError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                os.replace(self.path, self._segment(active))
+                active += 1
+                size = 0
+            elif size:
+                with open(self.path, 'rb') as f:
+                    f.seek(size - 1)
+                    if f.read(1) != b'\n':
+                        # Never glue our first line onto someone's unterminated one
+                        data = b'\n' + data
+                        size += 1
+            recs = []
+            offset = size
+            for event, line in zip(events, lines):
+                recs.append(RECORD.pack(_timestamp(event), active, offset, len(line)))
+                offset += len(line)
+            with open(self.path, 'ab') as f:
+                f.write(data)
+            with open(self.index_path, 'ab') as f:
+                f.write(b''.join(recs))
+
+    @contextmanager
+    def batch(self):
+        """Collect events with emit(event); they are appended in one go on exit."""
+        events = []
+        yield events.append
+        self.append(events)
+
+    # ─── Read ──────────────────────────────────────────────────────────────
+
+    def _load(self, recs):
+        active = self._active_seq()
+        events, files = [], {}
+        try:
+            for _, seq, offset, length in recs:
+                path = self._segment_path(seq, active)
+                if path not in files:
+                    try:
+                        files[path] = open(path, 'rb')
+                    except OSError:
+                        files[path] = None
+                f = files[path]
+                if f is None:
+                    continue
+                f.seek(offset)
+                try:
+                    events.append(json.loads(f.read(length)))
+                except ValueError:
+                    continue
+        finally:
+            for f in files.values():
+                if f:
+                    f.close()
+        return events
+
+    def tail(self, n):
+        """The last n events, oldest first."""
+        self.refresh()
+        total = len(self)
+        return self._load(self._records(max(0, total - n), min(n, total)))
+
+    def since(self, when):
+        """Events at or after `when` (datetime, ISO string or epoch seconds)."""
+        self.refresh()
+        target = _epoch(when)
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._records(mid, 1)[0][0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return self._load(self._records(lo, len(self) - lo))
+
+    def last(self, match, limit=10_000, block=256):
+        """Newest event for which match(event) is true, looking back at most
+        `limit` events (None if there is none)."""
+        self.refresh()
+        end = len(self)
+        stop = max(0, end - limit)
+        while end > stop:
+            start = max(stop, end - block)
+            for event in reversed(self._load(self._records(start, end - start))):
+                if match(event):
+                    return event
+            end = start
+        return None
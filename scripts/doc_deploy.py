@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Deploy — Local deploy queue between rendering and git push.
+
+Run: python3 scripts/doc_deploy.py status [--queue DIR] [--json]
+     python3 scripts/doc_deploy.py work --repo PATH [--queue DIR] [--base 5] [--max-attempts N]
+
+A build never waits for git: it records what it wrote as one small JSON file
+in the queue directory (~/.mirrordna/cache/deploy_queue/) and is done. A
+worker takes everything queued, squashes it into one commit (the union of
+the builds' paths, plus any generated output that changed without being
+queued) and pushes once. A failed link check, commit or push
+leaves the entries queued and backs off exponentially — BACKOFF_BASE ·
+2^(attempts-1), capped at BACKOFF_MAX — with the schedule kept next to the
+queue, so every process honours it. One worker at a time holds the queue's
+flock; any other returns at once and leaves the draining to it.
+
+Each attempt reports the builds and files it squashed, the queue depth left
+behind, the push latency and how long the oldest build waited. The worker
+only needs a working tree with an upstream, so `work --repo` against a
+clone of a local bare repository exercises the whole path.
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import argparse
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from doc_metrics import Metrics, peak_rss
+from doc_output import BuildLock
+from doc_links import check_links
+from generate_docs import generated_globs
+
+QUEUE_DIR = Path.home() / ".mirrordna" / "cache" / "deploy_queue"
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 900.0
+
+
+# ─── Git ──────────────────────────────────────────────────────────────────────
+
+def git(repo, metrics, phase, *args):
+    """Run one git command (argv, no shell) inside a metrics phase."""
+    with metrics.phase(phase) as rec:
+        result = subprocess.run(["git", *args], capture_output=True, text=True, cwd=str(repo))
+        rec['bytes'] = len(result.stdout) + len(result.stderr)
+        rec['rc'] = result.returncode
+        rec['child_peak_rss'] = peak_rss(children=True)
+    return result.stdout.rstrip(), result.stderr.strip(), result.returncode
+
+
+def status_paths(stdout):
+    """Paths from `git status --porcelain -z`: "XY path", and a rename's or
+    copy's original path as the field after it."""
+    paths, fields = [], iter(stdout.split("\0"))
+    for field in fields:
+        if not field:
+            continue
+        paths.append(field[3:])
+        if field[0] in "RC":
+            paths.append(next(fields, ""))
+    return [p for p in paths if p]
+
+
+def generated_changes(repo, metrics):
+    """Every generator-owned output that differs from HEAD — written,
+    modified or deleted — whether or not a queued build recorded it (a
+    manual generate_docs.py run, a build that died before enqueueing).
+    Returns (error string or None, [paths])."""
+    specs = [f":(glob){g}" for g in generated_globs()]
+    stdout, stderr, rc = git(repo, metrics, "git_status", "status", "--porcelain", "-z",
+                             "--untracked-files=all", "--", *specs)
+    if rc != 0:
+        return f"git status failed: {stderr}", []
+    return None, status_paths(stdout)
+
+
+def git_commit(repo, paths, message, metrics, amend=False):
+    """git add / git rm exactly `paths`, then commit them (or amend HEAD with
+    them). Returns (error string or None, sha of the commit made or None)."""
+    repo = Path(repo)
+    present = [p for p in paths if (repo / p).exists()]
+    gone = [p for p in paths if not (repo / p).exists()]
+    if present:
+        _, stderr, rc = git(repo, metrics, "git_add", "add", "--", *present)
+        if rc != 0:
+            return f"git add failed: {stderr}", None
+    if gone:
+        # Superseded fingerprinted assets — stage the deletions git can see
+        tracked, _, _ = git(repo, metrics, "git_ls_files", "ls-files", "--", *gone)
+        gone = tracked.splitlines()
+    if gone:
+        _, stderr, rc = git(repo, metrics, "git_rm", "rm", "--cached", "--quiet", "--", *gone)
+        if rc != 0:
+            return f"git rm failed: {stderr}", None
+    paths = present + gone
+    if not amend:
+        # Already committed by an attempt whose push failed
+        _, _, rc = git(repo, metrics, "git_diff", "diff", "--cached", "--quiet", "--", *paths)
+        if rc == 0:
+            return None, None
+    stdout, stderr, rc = git(repo, metrics, "git_commit", "commit", *(["--amend"] if amend else []),
+                             "-m", message, "--", *paths)
+    if rc != 0:
+        return f"Commit failed: {stderr or stdout}", None
+    sha, _, _ = git(repo, metrics, "git_rev_parse", "rev-parse", "HEAD")
+    return None, sha
+
+
+def git_deploy(repo, paths, message, metrics, log=print, amend=None):
+    """Stage `paths` plus every other changed generator output (additions,
+    edits and deletions), commit and push. Returns (error string or None,
+    sha of the commit made or None).
+
+    Nothing is committed while the tree that commit produces — the tracked
+    files plus the changes — has newly broken internal links.
+    "nothing to commit" is not an error: a previous attempt may have
+    committed and only failed to push. `amend` is the sha of such a commit;
+    while it is still HEAD it is amended rather than stacked on, so one
+    push carries one commit however many attempts it took.
+    """
+    # Check, stage and commit under the build lock: never mid-way through a build's commit
+    with BuildLock(repo):
+        error, generated = generated_changes(repo, metrics)
+        if error:
+            return error, None
+        unqueued = set(generated) - set(paths)
+        if unqueued:
+            log(f"Also committing {len(unqueued)} generated file(s) no build queued")
+        paths = sorted(set(paths) | unqueued)
+        tracked, stderr, rc = git(repo, metrics, "git_ls_files", "ls-files", "-z")
+        if rc != 0:
+            return f"git ls-files failed: {stderr}", None
+        files = {p for p in tracked.split("\0") if p} | set(paths)
+        files -= {p for p in paths if not (Path(repo) / p).exists()}
+        with metrics.phase("link_check") as rec:
+            broken, new = check_links(repo, files=files)
+            rec['broken'] = len(broken)
+        for b in broken:
+            log(f"{'Broken' if b in new else 'Known broken'} link: {b.page}:{b.line} {b.href} — {b.reason}")
+        if new:
+            return f"Link check failed: {len(new)} new broken link(s)", None
+        head, _, _ = git(repo, metrics, "git_rev_parse", "rev-parse", "HEAD")
+        error, sha = git_commit(repo, paths, message, metrics, amend=bool(amend) and head == amend)
+    if error:
+        return error, None
+    _, stderr, rc = git(repo, metrics, "git_push", "push")
+    if rc != 0:
+        return f"Push failed: {stderr}", sha
+    return None, sha
+
+
+# ─── Queue ────────────────────────────────────────────────────────────────────
+
+# Retry schedule; `unpushed` is the worker's own commit whose push failed
+IDLE = {"attempts": 0, "next_attempt": 0.0, "last_error": None, "unpushed": None}
+
+
+class DeployQueue:
+    """Queued builds, one JSON file each (named so that oldest sorts first),
+    plus the retry schedule in state.json."""
+
+    def __init__(self, path=QUEUE_DIR):
+        self.dir = Path(path)
+        self.state_path = self.dir / "state.json"
+        self.lock_path = self.dir / ".worker.lock"
+
+    def enqueue(self, paths, message, built_at=None, metrics=None):
+        """Record one build's written paths (and its Metrics.as_dict(), so
+        the deploy that ships it can report the build too). Atomic, and
+        never touches git."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "paths": sorted(paths),
+            "message": message,
+            "enqueued": time.time(),
+            "built_at": (built_at or datetime.now()).isoformat(),
+        }
+        if metrics:
+            entry["metrics"] = metrics
+        name = f"{time.time_ns():020d}-{os.getpid()}.json"
+        tmp = self.dir / f".{name}.tmp"
+        tmp.write_text(json.dumps(entry, ensure_ascii=False))
+        os.replace(tmp, self.dir / name)
+        return entry
+
+    def files(self):
+        if not self.dir.is_dir():
+            return []
+        return sorted(p for p in self.dir.glob("*.json") if p != self.state_path)
+
+    def depth(self):
+        return len(self.files())
+
+    def pending(self):
+        """[(file, entry)], oldest first."""
+        entries = []
+        for path in self.files():
+            try:
+                entries.append((path, json.loads(path.read_text())))
+            except (OSError, ValueError):
+                continue  # drained by a worker meanwhile
+        return entries
+
+    def remove(self, entries):
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+
+    def state(self):
+        try:
+            return dict(IDLE, **json.loads(self.state_path.read_text()))
+        except (OSError, ValueError):
+            return dict(IDLE)
+
+    def save_state(self, state):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.dir / ".state.json.tmp"
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.state_path)
+
+    @contextmanager
+    def worker_lock(self):
+        """Yields True to the one worker allowed to drain, False to any other."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def squash_message(entries):
+    """The newest build's message, noting how many builds the commit squashes."""
+    message = entries[-1][1]["message"]
+    return message if len(entries) == 1 else f"{message} — {len(entries)} builds"
+
+
+# ─── Worker ───────────────────────────────────────────────────────────────────
+
+class DeployWorker:
+    """Drains a DeployQueue into `repo`: one squashed commit + push per attempt.
+
+    on_report(report, metrics) is called after every attempt; `metrics`
+    holds the attempt's phases plus, under build/, those of every build it
+    squashed.
+    """
+
+    def __init__(self, queue, repo, log=print, on_report=None, base=BACKOFF_BASE, max_delay=BACKOFF_MAX):
+        self.queue = queue
+        self.repo = Path(repo)
+        self.log = log
+        self.on_report = on_report
+        self.base = base
+        self.max_delay = max_delay
+
+    def delay(self, attempts):
+        return min(self.max_delay, self.base * 2 ** (attempts - 1))
+
+    def wait_time(self):
+        """Seconds until the backoff allows the next attempt."""
+        return max(0.0, self.queue.state()["next_attempt"] - time.time())
+
+    def attempt(self):
+        """Deploy everything queued right now. Call with the worker lock held.
+
+        Returns None on an empty queue, else the report: ok, builds, files,
+        depth (entries left, including any queued meanwhile), push_ms (the
+        git push alone, None if it never ran), deploy_ms (the whole attempt:
+        status, link check, commit and push), wait_s (age of the oldest build), message, and built_at (newest
+        build) on success or error / attempts / retry_in on failure.
+        """
+        entries = self.queue.pending()
+        if not entries:
+            return None
+        metrics = Metrics()
+        state = self.queue.state()
+        paths = sorted({p for _, entry in entries for p in entry["paths"]})
+        message = squash_message(entries)
+        t0 = time.perf_counter()
+        with metrics.phase("deploy", builds=len(entries), files=len(paths)):
+            error, sha = git_deploy(self.repo, paths, message, metrics, self.log, state["unpushed"])
+        for _, entry in entries:
+            metrics.merge(entry.get("metrics", {}), prefix="build/")
+        pushes = [rec["ms"] for rec in metrics.phases if rec["phase"] == "git_push"]
+        report = {
+            "ok": error is None,
+            "builds": len(entries),
+            "files": len(paths),
+            "push_ms": round(pushes[-1], 1) if pushes else None,
+            "deploy_ms": round((time.perf_counter() - t0) * 1000, 1),
+            "wait_s": round(time.time() - entries[0][1]["enqueued"], 1),
+            "message": message,
+        }
+        if error:
+            state["attempts"] += 1
+            retry_in = self.delay(state["attempts"])
+            state.update(next_attempt=time.time() + retry_in, last_error=error,
+                         unpushed=sha or state["unpushed"])
+            self.queue.save_state(state)
+            report.update(error=error, attempts=state["attempts"], retry_in=retry_in)
+        else:
+            self.queue.remove(entries)
+            self.queue.save_state(dict(IDLE))
+            report["built_at"] = max(entry["built_at"] for _, entry in entries)
+        report["depth"] = self.queue.depth()
+
+        if error:
+            self.log(f"{error} — {report['builds']} build(s) stay queued, "
+                     f"retry {report['attempts']} in {report['retry_in']:g}s")
+        else:
+            self.log(f"Deployed: {message} ({report['builds']} build(s), {report['files']} files, "
+                     f"push {report['push_ms']:.0f} ms of {report['deploy_ms']:.0f} ms, oldest queued {report['wait_s']:.0f}s, "
+                     f"queue depth {report['depth']})")
+        if self.on_report:
+            self.on_report(report, metrics)
+        return report
+
+    def run(self, wake=None, stop=None, interval=0.0, max_attempts=None):
+        """Deploy until the queue is empty, sleeping through backoffs.
+
+        With a `wake` Event (set by whoever enqueues), keep serving until
+        `stop` is set instead. Successful pushes are at least `interval`
+        seconds apart, so bursts of builds squash into one commit. Gives up
+        after `max_attempts` failed attempts in a row — the entries stay
+        queued. Returns False if another worker holds the queue.
+        """
+        with self.queue.worker_lock() as mine:
+            if not mine:
+                return False
+            last_push, failures = float("-inf"), 0
+            while not (stop and stop.is_set()):
+                timeout = None
+                if self.queue.depth():
+                    timeout = max(self.wait_time(), last_push + interval - time.monotonic())
+                    if timeout <= 0:
+                        report = self.attempt()
+                        if report and report["ok"]:
+                            last_push, failures = time.monotonic(), 0
+                        elif report:
+                            failures += 1
+                            if max_attempts and failures >= max_attempts:
+                                return True
+                        continue
+                elif wake is None:
+                    return True
+                if wake is None:
+                    time.sleep(timeout)
+                else:
+                    wake.wait(timeout)
+                    wake.clear()
+            return True
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Inspect or drain the MirrorDNA-Docs deploy queue")
+    ap.add_argument("mode", choices=["status", "work"])
+    ap.add_argument("--queue", type=Path, default=QUEUE_DIR)
+    ap.add_argument("--repo", type=Path, help="work: the working tree to commit in and push from")
+    ap.add_argument("--base", type=float, default=BACKOFF_BASE, help="work: first retry delay in seconds")
+    ap.add_argument("--max-attempts", type=int, default=None, help="work: give up after N failures in a row")
+    ap.add_argument("--json", action="store_true", help="status: print JSON")
+    args = ap.parse_args(argv)
+    queue = DeployQueue(args.queue)
+
+    if args.mode == "work":
+        if not args.repo:
+            ap.error("work needs --repo")
+        if not DeployWorker(queue, args.repo, base=args.base).run(max_attempts=args.max_attempts):
+            print("  Another deploy worker is draining this queue")
+        return 1 if queue.depth() else 0
+
+    entries = queue.pending()
+    state = queue.state()
+    status = {
+        "depth": len(entries),
+        "paths": len({p for _, entry in entries for p in entry["paths"]}),
+        "oldest_s": round(time.time() - entries[0][1]["enqueued"], 1) if entries else None,
+        "attempts": state["attempts"],
+        "retry_in": round(max(0.0, state["next_attempt"] - time.time()), 1),
+        "last_error": state["last_error"],
+    }
+    if args.json:
+        print(json.dumps(status, indent=1))
+        return 0
+    print(f"  Queue: {status['depth']} build(s), {status['paths']} path(s)"
+          + (f", oldest {status['oldest_s']:.0f}s" if entries else ""))
+    if status["attempts"]:
+        print(f"  Failing: {status['attempts']} attempt(s), next in {status['retry_in']:.0f}s — {status['last_error']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Links — Internal link and anchor checker for the docs tree.
+
+Run: python3 scripts/doc_links.py [--jobs N] [--processes]
+
+Every HTML page (generated or hand-written) is streamed through an
+HTMLParser in parallel, collecting its ids and its links. Links are then
+resolved the way a browser would — against the page's <base href> when it
+has one — and checked against the set of files in the tree and a global
+anchor index, so `security/#kavach` fails if security/index.html loses its
+id="kavach". External URLs are not fetched.
+
+Per-page results are cached by content hash in ~/.mirrordna/cache/links.json;
+a re-check parses only the pages that changed.
+
+The deploy worker runs this before every commit + push, over the files
+that commit leaves in the tree (tracked or about to be), so a link to an
+output nobody committed fails too. Broken links that were already present
+at the last passing check are reported but do not block a deploy; new ones
+do. (The first check just records what it finds.)
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+from generate_docs import CACHE_DIR, DOCS_DIR
+from doc_output import STAGING_DIR
+
+SITE_PATH = '/MirrorDNA-Docs/'   # where the docs tree is served (GitHub Pages)
+LINK_CACHE = CACHE_DIR / 'links.json'
+CACHE_VERSION = 1
+SKIP_DIRS = {'.git', STAGING_DIR, 'node_modules'}
+READ_BLOCK = 1 << 16
+
+# tag → attribute holding a URL
+LINK_ATTRS = {'a': 'href', 'area': 'href', 'link': 'href', 'img': 'src',
+              'script': 'src', 'iframe': 'src', 'source': 'src'}
+
+Broken = namedtuple('Broken', 'page line href reason')
+
+
+class PageScanner(HTMLParser):
+    """Collects a page's base href, ids and (line, url) links."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.base = None
+        self.ids = set()
+        self.links = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        if tag == 'a' and attrs.get('name'):
+            self.ids.add(attrs['name'])
+        if tag == 'base' and self.base is None and attrs.get('href'):
+            self.base = attrs['href']
+            return
+        url = attrs.get(LINK_ATTRS.get(tag))
+        if url:
+            self.links.append((self.getpos()[0], url))
+
+    handle_startendtag = handle_starttag
+
+
+def scan_page(path, known=None):
+    """Hash a page and, unless the hash equals `known`, parse it.
+
+    Returns (sha256, None) for an unchanged page, else
+    (sha256, {'base', 'ids', 'links'}).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    sha = hashlib.sha256(data).hexdigest()
+    if sha == known:
+        return sha, None
+    scanner = PageScanner()
+    text = data.decode('utf-8', errors='replace')
+    for pos in range(0, len(text), READ_BLOCK):
+        scanner.feed(text[pos:pos + READ_BLOCK])
+    scanner.close()
+    return sha, {'base': scanner.base, 'ids': sorted(scanner.ids), 'links': scanner.links}
+
+
+def site_files(root):
+    """Every file in the tree, as root-relative paths."""
+    files = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        rel = os.path.relpath(dirpath, root)
+        for name in filenames:
+            files.add(name if rel == '.' else f'{rel}/{name}'.replace(os.sep, '/'))
+    return files
+
+
+def load_cache(path):
+    try:
+        cache = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get('version') == CACHE_VERSION else {}
+
+
+def resolve(page, base, href, files, ids):
+    """Why `href` on `page` is broken, or None if it resolves."""
+    url = urljoin(SITE_PATH + page, base) if base else SITE_PATH + page
+    target = urlsplit(urljoin(url, href))
+    if target.scheme or target.netloc:
+        return None  # external (http:, mailto:, data:, …) — not checked
+    path = unquote(target.path)
+    if not path.startswith(SITE_PATH):
+        return f'outside {SITE_PATH}'
+    rel = path[len(SITE_PATH):]
+    if rel == '' or rel.endswith('/'):
+        rel += 'index.html'
+    if rel not in files:
+        if f'{rel}/index.html' not in files:
+            return f'missing {rel}'
+        rel += '/index.html'
+    frag = unquote(target.fragment)
+    if frag and rel in ids and frag not in ids[rel]:
+        return f'no #{frag} in {rel}'
+    return None
+
+
+def check_links(root=DOCS_DIR, cache_path=LINK_CACHE, jobs=None, processes=False, files=None):
+    """Check every internal link and anchor under `root`.
+
+    `files` (root-relative paths) stands in for the tree's contents — the
+    set a commit is about to contain rather than whatever is on disk.
+    Returns (broken, new): all broken links, and those not already broken at
+    the last passing check. The cache is updated either way; the accepted
+    set only when nothing new broke.
+    """
+    root = Path(root)
+    cache = load_cache(cache_path)
+    entries = cache.get('pages', {})
+    if files is None:
+        files = site_files(root)
+        pages = sorted(f for f in files if f.endswith('.html'))
+    else:
+        files = set(files)
+        pages = sorted(f for f in files if f.endswith('.html') and (root / f).is_file())
+
+    pool = ProcessPoolExecutor(jobs) if processes else ThreadPoolExecutor(jobs)
+    with pool:
+        futures = {rel: pool.submit(scan_page, root / rel, entries.get(rel, {}).get('sha256'))
+                   for rel in pages}
+        scanned = {}
+        for rel, future in futures.items():
+            sha, entry = future.result()
+            scanned[rel] = dict(entry, sha256=sha) if entry else entries[rel]
+
+    ids = {rel: set(entry['ids']) for rel, entry in scanned.items()}
+    broken = []
+    for rel, entry in scanned.items():
+        for line, href in entry['links']:
+            reason = resolve(rel, entry['base'], href, files, ids)
+            if reason:
+                broken.append(Broken(rel, line, href, reason))
+
+    accepted = cache.get('accepted')
+    if accepted is None:
+        accepted = [[b.page, b.href] for b in broken]  # first check: baseline
+    known = {tuple(a) for a in accepted}
+    new = [b for b in broken if (b.page, b.href) not in known]
+    if not new:
+        accepted = [[b.page, b.href] for b in broken]
+
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({'version': CACHE_VERSION, 'pages': scanned, 'accepted': accepted},
+                                     ensure_ascii=False))
+    return broken, new
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Check internal links and anchors in MirrorDNA-Docs')
+    ap.add_argument('--root', type=Path, default=DOCS_DIR)
+    ap.add_argument('--jobs', type=int, default=None, help='parser workers')
+    ap.add_argument('--processes', action='store_true', help='parse in a process pool instead of threads')
+    args = ap.parse_args(argv)
+
+    print('⟡ MirrorDNA Link Check')
+    broken, new = check_links(args.root, jobs=args.jobs, processes=args.processes)
+    new = set(new)
+    for b in broken:
+        print(f"  {'✗' if b in new else '⚠'} {b.page}:{b.line} {b.href} — {b.reason}")
+    print(f'  {len(broken)} broken ({len(new)} new)' if broken else '  ✓ All internal links resolve')
+    return 1 if broken else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
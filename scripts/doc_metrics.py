@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Metrics — Per-phase timing and memory for the doc pipeline.
+
+Shared by generate_docs.py and doc_sync.py. Each phase records wall time,
+peak RSS and a byte count; the result is a plain dict that goes into the
+bus event so the pipeline's cost can be charted over time.
+
+    metrics = Metrics()
+    with metrics.phase('parse') as p:
+        sections = parse_shiplog()
+        p['bytes'] = SHIPLOG.stat().st_size
+
+With profiling on, phases also run under cProfile and tracemalloc and the
+dumps land in ~/.mirrordna/logs/doc_profile/.
+"""
+
+import sys
+import time
+import resource
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_DIR = Path.home() / ".mirrordna" / "logs" / "doc_profile"
+
+# ru_maxrss is bytes on macOS, kilobytes on Linux
+_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def peak_rss(children=False):
+    """Peak resident set size in bytes (of this process, or of its reaped children)."""
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    return resource.getrusage(who).ru_maxrss * _RSS_UNIT
+
+
+class Metrics:
+    """Collects per-phase measurements for one pipeline run."""
+
+    def __init__(self, profile=False, profile_dir=PROFILE_DIR):
+        self.phases = []
+        self.profile = profile
+        self.profile_dir = Path(profile_dir)
+        self.dumps = []
+        self._depth = 0
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, **fields):
+        """Time a block. Yields the record so the block can add 'bytes' etc."""
+        rec = {'phase': name, **fields}
+        # Only outermost phases are profiled — cProfile does not nest
+        prof = cProfile.Profile() if self.profile and not self._depth else None
+        if self.profile and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        self._depth += 1
+        if prof:
+            prof.enable()
+        try:
+            yield rec
+        finally:
+            self._depth -= 1
+            if prof:
+                prof.disable()
+            rec['ms'] = round((time.perf_counter() - t0) * 1000, 3)
+            rec['peak_rss'] = peak_rss()
+            self.phases.append(rec)
+            if prof:
+                self._dump(name, prof)
+
+    def record(self, name, ms, **fields):
+        """Add a phase measured elsewhere (e.g. inside a worker thread)."""
+        self.phases.append({'phase': name, 'ms': round(ms, 3), **fields})
+
+    def merge(self, other, prefix=''):
+        """Fold in phases reported by another component (dict from as_dict())."""
+        for rec in other.get('phases', []):
+            self.phases.append({**rec, 'phase': prefix + rec['phase']})
+
+    def _dump(self, name, prof):
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{name.replace('/', '_').replace(':', '_')}"
+        prof_path = self.profile_dir / f'{stem}.prof'
+        prof.dump_stats(prof_path)
+        self.dumps.append(str(prof_path))
+        if tracemalloc.is_tracing():
+            top = tracemalloc.take_snapshot().statistics('lineno')[:25]
+            mem_path = self.profile_dir / f'{stem}.tracemalloc.txt'
+            mem_path.write_text('\n'.join(str(stat) for stat in top) + '\n')
+            self.dumps.append(str(mem_path))
+
+    def as_dict(self):
+        out = {
+            'total_ms': round((time.perf_counter() - self._t0) * 1000, 3),
+            'peak_rss': peak_rss(),
+            'phases': self.phases,
+        }
+        if self.dumps:
+            out['profile_dumps'] = self.dumps
+        return out
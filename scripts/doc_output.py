@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Output — Build lock and transactional output for the docs tree.
+
+    with BuildLock(DOCS_DIR) as lock:
+        if lock.covered:                 # a build that started after our trigger
+            return                       # already finished — nothing to do
+        staging = Staging(DOCS_DIR)      # new files go to .doc-staging/ …
+        write(staging.dir / 'index.html')
+        staging.remove('styles.0123456789.css')
+        staging.commit()                 # … fsync'd in one batch, then renamed in
+        lock.completed()
+
+A crash before commit() leaves the live tree untouched (the next build
+clears the staging directory). Every file is replaced with an atomic
+rename, data files before the HTML that links them, so a reader or a
+concurrent `git add` never sees a half-written page.
+"""
+
+import os
+import time
+import fcntl
+import shutil
+from pathlib import Path
+
+BUILD_LOCK = '.doc-build.lock'
+STAGING_DIR = '.doc-staging'
+
+
+class BuildLock:
+    """The single build lock of a docs tree: flock(2) on ROOT/.doc-build.lock.
+
+    Concurrent builds queue on it. The lock file records when the last
+    completed build started; a build that waited while a later-triggered
+    one ran finds `covered` set and can skip its own run.
+    """
+
+    def __init__(self, root, requested=None):
+        self.path = Path(root) / BUILD_LOCK
+        self.requested = time.time() if requested is None else requested
+        self.covered = False
+        self.started = None
+        self.file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a+')
+        try:
+            fcntl.flock(self.file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print('  Waiting for the running build to finish…')
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        self.started = time.time()
+        self.file.seek(0)
+        try:
+            last = float(self.file.read().strip() or 0)
+        except ValueError:
+            last = 0.0
+        self.covered = last > self.requested
+        return self
+
+    def completed(self):
+        """Record this build as the latest completed one."""
+        self.file.seek(0)
+        self.file.truncate()
+        self.file.write(f'{self.started}\n')
+        self.file.flush()
+
+    def __exit__(self, *exc):
+        fcntl.flock(self.file, fcntl.LOCK_UN)
+        self.file.close()
+        self.file = None
+
+
+def _fsync(path, flags=os.O_RDONLY):
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class Staging:
+    """One output transaction: files written under ROOT/.doc-staging/ (same
+    relative paths) go live together on commit()."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.dir = self.root / STAGING_DIR
+        shutil.rmtree(self.dir, ignore_errors=True)  # left over from a crashed build
+        self.dir.mkdir(parents=True)
+        self.removals = []
+
+    def remove(self, rel):
+        """Delete ROOT/rel as part of the commit."""
+        self.removals.append(rel)
+
+    def commit(self):
+        """fsync every staged file, rename them into place (HTML last), apply
+        removals, fsync the touched directories. Returns the committed paths."""
+        staged = sorted((p for p in self.dir.rglob('*') if p.is_file()),
+                        key=lambda p: (p.suffix == '.html', str(p)))
+        for path in staged:
+            _fsync(path)
+        dirs = set()
+        for path in staged:
+            dest = self.root / path.relative_to(self.dir)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(path, dest)
+            dirs.add(dest.parent)
+        for rel in self.removals:
+            dest = self.root / rel
+            if dest.exists():
+                dest.unlink()
+                dirs.add(dest.parent)
+        for d in dirs:
+            _fsync(d)
+        shutil.rmtree(self.dir, ignore_errors=True)
+        return [str(p.relative_to(self.dir)) for p in staged]
+
+    def abort(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
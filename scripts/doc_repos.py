@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Repos — Concurrent, cached scanner for the repos under ~/repos.
+
+Run: python3 scripts/doc_repos.py [scan|audit] [--json] [--no-public]
+
+    scan    repo count, public count, most recently committed repos
+    audit   README check per repo (missing / sparse / line count, last modified)
+
+Every repo is inspected in a thread pool. A repo's entry is reused as long
+as its HEAD commit (read straight from .git, no fork) and its README mtime
+are unchanged, so a re-scan of ~100 untouched repos costs a few stats each;
+`git log` only runs for repos whose HEAD moved.
+
+The report (~/.mirrordna/cache/repos.json) is also what generate_docs.py
+reads for the homepage's repo and public counts. The public count comes
+from `gh repo list` when the GitHub CLI is installed and is refreshed at
+most every PUBLIC_TTL seconds; otherwise the last known value is kept.
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+REPOS_DIR = Path.home() / "repos"
+REPORT = Path.home() / ".mirrordna" / "cache" / "repos.json"
+REPORT_VERSION = 1
+ORG = 'MirrorDNA-Reflection-Protocol'
+README = 'README.md'
+SPARSE_LINES = 10
+PUBLIC_TTL = 6 * 3600
+
+# Shown until a scan has produced a report
+REPO_DEFAULTS = {'repos': 95, 'public': 63}
+
+GREEN, YELLOW, NC = '\033[0;32m', '\033[1;33m', '\033[0m'
+
+
+def git_dir(repo):
+    """The repo's git directory (following a `gitdir:` file), or None."""
+    dot = repo / '.git'
+    if dot.is_dir():
+        return dot
+    if dot.is_file():
+        text = dot.read_text().strip()
+        if text.startswith('gitdir:'):
+            return (repo / text[7:].strip()).resolve()
+    return None
+
+
+def head_commit(gdir):
+    """(ref, sha) of HEAD, read from the ref files. sha is None on an unborn branch."""
+    head = (gdir / 'HEAD').read_text().strip()
+    if not head.startswith('ref:'):
+        return None, head  # detached
+    ref = head[4:].strip()
+    loose = gdir / ref
+    if loose.exists():
+        return ref, loose.read_text().strip()
+    packed = gdir / 'packed-refs'
+    if packed.exists():
+        for line in packed.read_text().splitlines():
+            if line.endswith(' ' + ref):
+                return ref, line.split()[0]
+    return ref, None
+
+
+def _mtime(path):
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def scan_repo(repo, cached=None):
+    """Report entry for one repo; `cached` is its entry from the last scan."""
+    cached = cached or {}
+    gdir = git_dir(repo)
+    ref, sha = head_commit(gdir) if gdir else (None, None)
+    readme = repo / README
+    readme_mtime = _mtime(readme)
+    if cached.get('head') == sha and cached.get('readme_mtime') == readme_mtime and 'readme_lines' in cached:
+        return dict(cached, changed=False)
+
+    entry = {'head': sha, 'ref': ref, 'readme_mtime': readme_mtime, 'readme_lines': None,
+             'last_commit': None, 'subject': None, 'changed': True}
+    if readme_mtime is not None:
+        with open(readme, 'rb') as f:
+            entry['readme_lines'] = f.read().count(b'\n')
+    if sha and cached.get('head') == sha:
+        entry['last_commit'], entry['subject'] = cached.get('last_commit'), cached.get('subject')
+    elif sha:
+        result = subprocess.run(['git', '-C', str(repo), 'log', '-1', '--format=%cI%x00%s'],
+                                capture_output=True, text=True)
+        if result.returncode == 0 and '\0' in result.stdout:
+            entry['last_commit'], entry['subject'] = result.stdout.strip('\n').split('\0', 1)
+    return entry
+
+
+def public_repos(org=ORG):
+    """Names of the org's public repos via the GitHub CLI (None if unavailable)."""
+    if not shutil.which('gh'):
+        return None
+    try:
+        result = subprocess.run(['gh', 'repo', 'list', org, '--visibility', 'public', '--limit', '1000',
+                                 '--json', 'name', '--jq', '.[].name'],
+                                capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return sorted(result.stdout.split())
+
+
+def load_report(path=REPORT):
+    try:
+        report = json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return report if report.get('version') == REPORT_VERSION else {}
+
+
+def scan(root=REPOS_DIR, path=REPORT, jobs=None, public=True):
+    """Scan every repo under `root`, update the report at `path` and return it."""
+    root = Path(root)
+    old = load_report(path)
+    cached = old.get('repos', {})
+    repos = sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith('.')) if root.is_dir() else []
+
+    with ThreadPoolExecutor(jobs or min(32, len(repos) or 1)) as pool:
+        entries = dict(zip((r.name for r in repos),
+                           pool.map(lambda r: scan_repo(r, cached.get(r.name)), repos)))
+
+    names, checked = old.get('public_repos'), old.get('public_checked', 0)
+    if public and time.time() - checked >= PUBLIC_TTL:
+        fresh = public_repos()
+        if fresh is not None:
+            names, checked = fresh, time.time()
+
+    report = {
+        'version': REPORT_VERSION,
+        'scanned': datetime.now().isoformat(timespec='seconds'),
+        'root': str(root),
+        'total': len(entries),
+        'git': sum(1 for e in entries.values() if e['head']),
+        'public': len(names) if names is not None else None,
+        'public_repos': names,
+        'public_checked': checked,
+        'repos': entries,
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(report, indent=1, ensure_ascii=False))
+    return report
+
+
+def repo_stats(path=REPORT):
+    """{'repos': n, 'public': n} for the homepage, from the last scan."""
+    report = load_report(path)
+    stats = dict(REPO_DEFAULTS)
+    if report.get('total'):
+        stats['repos'] = report['total']
+    if report.get('public') is not None:
+        stats['public'] = report['public']
+    return stats
+
+
+def print_scan(report, ms):
+    changed = sum(1 for e in report['repos'].values() if e['changed'])
+    public = report['public'] if report['public'] is not None else 'unknown'
+    print(f"  {report['total']} repos ({public} public) — {changed} changed since last scan, {ms:.0f} ms")
+    dated = sorted((e['last_commit'], name, e['subject']) for name, e in report['repos'].items() if e['last_commit'])
+    if dated:
+        print('  Recently committed:')
+    for when, name, subject in reversed(dated[-10:]):
+        print(f'    {when[:10]} {name}: {subject}')
+
+
+def print_audit(report):
+    for name, e in report['repos'].items():
+        lines = e['readme_lines']
+        if lines is None:
+            print(f'  {YELLOW}⚠{NC} {name}: No README')
+            continue
+        modified = datetime.fromtimestamp(e['readme_mtime']).strftime('%Y-%m-%d')
+        if lines < SPARSE_LINES:
+            print(f'  {YELLOW}⚠{NC} {name}: {lines} lines (sparse), modified {modified}')
+        else:
+            print(f'  {GREEN}✓{NC} {name}: {lines} lines, modified {modified}')
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Scan the repos under ~/repos (cached, concurrent)')
+    ap.add_argument('mode', nargs='?', choices=['scan', 'audit'], default='scan')
+    ap.add_argument('--root', type=Path, default=REPOS_DIR)
+    ap.add_argument('--jobs', type=int, default=None, help='scanner threads')
+    ap.add_argument('--no-public', action='store_true', help='do not ask GitHub for the public repo count')
+    ap.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    report = scan(args.root, jobs=args.jobs, public=not args.no_public)
+    ms = (time.perf_counter() - t0) * 1000
+    if args.json:
+        print(json.dumps(report, indent=1, ensure_ascii=False))
+    elif args.mode == 'audit':
+        print_audit(report)
+    else:
+        print_scan(report, ms)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Serve — Local preview of the generated docs, straight from memory.
+
+Run: python3 scripts/doc_serve.py [--port 8000]
+     open http://127.0.0.1:8000/
+
+The ship logs are parsed once and kept warm; generated pages are rendered
+on request and cached until their build-graph fingerprint changes. Every
+other path (hand-written pages, styles.css, …) is read from the docs tree.
+`<base href="/MirrorDNA-Docs/">` is rewritten to `/` so links work on
+localhost, and each HTML page gets a tiny EventSource client: when a ship
+log changes, the logs are re-parsed (appended tail only) and open pages
+reload themselves.
+
+Nothing is written to disk — no pages, no checkpoints, no build graph.
+"""
+
+import sys
+import time
+import argparse
+import mimetypes
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+import generate_docs
+from doc_watch import make_watcher, settle
+
+BASE_HREF = '<base href="/MirrorDNA-Docs/">'
+LOCAL_BASE_HREF = '<base href="/">'
+RELOAD_PATH = '/__reload'
+RELOAD_CLIENT = f'''<script>
+new EventSource('{RELOAD_PATH}').onmessage = function () {{ location.reload(); }};
+</script>
+</body>'''
+KEEPALIVE = 15.0
+
+
+def localize(html):
+    """Make a page browsable from localhost and live-reloading."""
+    return html.replace(BASE_HREF, LOCAL_BASE_HREF, 1).replace('</body>', RELOAD_CLIENT, 1)
+
+
+class Preview:
+    """Warm parse of every ship log plus a cache of rendered pages."""
+
+    def __init__(self):
+        # In-memory parsers (no checkpoint file) so re-parses only read the tail
+        self.sources = generate_docs.discover_sources()
+        self.parsers = {s.name: generate_docs.ShiplogParser(s.path, None) for s in self.sources}
+        self.graph = generate_docs.BuildGraph(None)
+        self.aggregates = generate_docs.Aggregates(None)
+        self.cache = {}  # output → (fingerprint, body)
+        self.lock = threading.Lock()
+        self.changed = threading.Condition()
+        self.version = 0
+        self.reload()
+
+    def reload(self):
+        t0 = time.perf_counter()
+        parsed = generate_docs.parse_sources(self.sources, parsers=self.parsers)
+        store = generate_docs.ShipStore(*parsed)
+        store.stats = self.aggregates.update_parsed(self.sources, parsed).stats(generate_docs.repo_stats())
+        pages = {page.output: page for page in generate_docs.all_pages(store)}
+        with self.lock:
+            self.store, self.pages = store, pages
+        with self.changed:
+            self.version += 1
+            self.changed.notify_all()
+        print(f'  Parsed: {store.total} ships, {len(pages)} pages ({(time.perf_counter() - t0) * 1000:.1f} ms)')
+
+    def page(self, output):
+        """Rendered body of a generated output (None if it is not one)."""
+        with self.lock:
+            store, page = self.store, self.pages.get(output)
+        if page is None:
+            return None
+        fp, _ = self.graph.fingerprint(page, store)
+        cached = self.cache.get(output)
+        if cached and cached[0] == fp:
+            return cached[1]
+        t0 = time.perf_counter()
+        chunks, _ = page.render(store)
+        text = chunks if isinstance(chunks, str) else ''.join(chunks)
+        if output.endswith('.html'):
+            text = localize(text)
+        body = text.encode()
+        self.cache[output] = (fp, body)
+        print(f'  ✓ rendered {output} in {(time.perf_counter() - t0) * 1000:.1f} ms')
+        return body
+
+    def watch(self, debounce, poll=False):
+        watcher = make_watcher([s.path for s in self.sources], poll=poll)
+        while True:
+            if watcher.wait(None):
+                settle(watcher, debounce)
+                self.reload()
+
+    def wait_change(self, version, timeout):
+        with self.changed:
+            self.changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+
+class Handler(BaseHTTPRequestHandler):
+    preview = None
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        path = unquote(urlsplit(self.path).path)
+        if path == RELOAD_PATH:
+            return self.events()
+        rel = path.lstrip('/')
+        if rel == '' or rel.endswith('/'):
+            rel += 'index.html'
+        if '..' in rel.split('/'):
+            return self.send_error(403)
+
+        body = self.preview.page(rel)
+        if body is None:
+            file = generate_docs.DOCS_DIR / rel
+            if file.is_dir():
+                self.send_response(301)
+                self.send_header('Location', path + '/')
+                self.end_headers()
+                return
+            if not file.is_file():
+                return self.send_error(404)
+            body = file.read_bytes()
+            if rel.endswith('.html'):
+                body = localize(body.decode()).encode()
+
+        ctype = mimetypes.guess_type(rel)[0] or 'application/octet-stream'
+        if ctype.startswith('text/') or ctype in ('application/json', 'image/svg+xml'):
+            ctype += '; charset=utf-8'
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def events(self):
+        """Server-sent events: one 'reload' message per ship log change."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        version = self.preview.version
+        try:
+            while True:
+                now = self.preview.wait_change(version, KEEPALIVE)
+                self.wfile.write(b'data: reload\n\n' if now != version else b': keepalive\n\n')
+                self.wfile.flush()
+                version = now
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Preview MirrorDNA-Docs locally, rendered from memory')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8000)
+    ap.add_argument('--debounce', type=float, default=0.2, help='seconds of quiet before re-parsing')
+    ap.add_argument('--poll', action='store_true', help='use stat() polling instead of inotify')
+    args = ap.parse_args(argv)
+
+    # Plain asset names: the preview never writes fingerprinted copies
+    generate_docs.ASSET_STAGE = False
+
+    print('⟡ MirrorDNA Doc Serve')
+    if not generate_docs.SHIPLOG.exists():
+        print(f'  ERROR: {generate_docs.SHIPLOG} not found')
+        return 1
+    Handler.preview = Preview()
+    threading.Thread(target=Handler.preview.watch, args=(args.debounce, args.poll), daemon=True).start()
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    server.daemon_threads = True
+    print(f'  Serving http://{args.host}:{args.port}/ — Ctrl-C to stop')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Store — The parsed ship logs, persisted in SQLite.
+
+Run: python3 scripts/doc_store.py query [--section Kavach] [--since 2026-03-01 | 30d]
+                                        [--until D] [--module M] [--text "scam shield"]
+                                        [--count-by section|module|date|month] [--limit N] [--json]
+
+generate_docs.py syncs the store after every parse; `generate_docs.py
+--from-db` renders from it without reading the logs at all.
+
+    ships     one row per ship: source, section, seq (order within the
+              section), module, name, desc, date — indexed on date, section
+              and module
+    ships_fts FTS5 over name + desc (external content, kept in step by triggers)
+    sections  per source, the sections in log order (empty ones included),
+              each with its row count + SHA-256 over its rows
+    sources   per source, row count + SHA-256 over all of it
+
+Updates are incremental. A source whose digest is unchanged is skipped.
+Within a changed source, each section is compared on its own: when its
+stored rows are still a prefix of the new ones (items appended, even under
+a heading that appears again further down the log) only its tail is
+inserted; otherwise just that section is rewritten.
+"""
+
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+DB_PATH = Path.home() / ".mirrordna" / "cache" / "ships.db"
+SCHEMA_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, count INTEGER NOT NULL, digest TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sections (
+    source TEXT NOT NULL, pos INTEGER NOT NULL, name TEXT NOT NULL, module TEXT,
+    count INTEGER NOT NULL, digest TEXT NOT NULL,
+    PRIMARY KEY (source, pos));
+CREATE TABLE IF NOT EXISTS ships (
+    id INTEGER PRIMARY KEY, source TEXT NOT NULL, seq INTEGER NOT NULL,
+    section TEXT NOT NULL, module TEXT, name TEXT NOT NULL, desc TEXT NOT NULL, date TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS ships_source_section ON ships (source, section, seq);
+CREATE INDEX IF NOT EXISTS ships_date ON ships (date);
+CREATE INDEX IF NOT EXISTS ships_section ON ships (section, date);
+CREATE INDEX IF NOT EXISTS ships_module ON ships (module, date);
+'''
+
+FTS_SCHEMA = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS ships_fts USING fts5(name, desc, content='ships', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS ships_ai AFTER INSERT ON ships BEGIN
+    INSERT INTO ships_fts (rowid, name, desc) VALUES (new.id, new.name, new.desc);
+END;
+CREATE TRIGGER IF NOT EXISTS ships_ad AFTER DELETE ON ships BEGIN
+    INSERT INTO ships_fts (ships_fts, rowid, name, desc) VALUES ('delete', old.id, old.name, old.desc);
+END;
+'''
+
+COUNT_BY = {'section': 'ships.section', 'module': "coalesce(ships.module, '')",
+            'date': 'ships.date', 'month': 'substr(ships.date, 1, 7)'}
+
+
+def _line(row):
+    return json.dumps(row, ensure_ascii=False).encode() + b'\n'
+
+
+class ShipDB:
+    """SQLite ship store. One connection, used from one thread."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            self.db.executescript('DROP TRIGGER IF EXISTS ships_ai; DROP TRIGGER IF EXISTS ships_ad; '
+                                  'DROP TABLE IF EXISTS ships_fts; DROP TABLE IF EXISTS ships; '
+                                  'DROP TABLE IF EXISTS sections; DROP TABLE IF EXISTS sources;')
+            self.db.execute(f'PRAGMA user_version={SCHEMA_VERSION}')
+        self.db.executescript(SCHEMA)
+        try:
+            self.db.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False  # SQLite built without FTS5: --text falls back to LIKE
+
+    def close(self):
+        self.db.close()
+
+    # ─── Write ─────────────────────────────────────────────────────────────
+
+    def sync(self, name, sections):
+        """Bring one source's rows in line with its parsed `sections`, one
+        section at a time. Returns (inserted, deleted)."""
+        stored = {section: (count, digest) for section, count, digest in self.db.execute(
+            'SELECT name, count, digest FROM sections WHERE source = ?', (name,))}
+        whole = hashlib.sha256()
+        plan = []  # (section, module, rows, digest, first row to insert)
+        for section, data in sections.items():
+            rows = [(section, data['module'], it['name'], it['desc'], it['date']) for it in data['items']]
+            old_count, old_digest = stored.get(section, (0, None))
+            h = hashlib.sha256()
+            prefix = None
+            whole.update(_line([section, data['module']]))
+            for i, row in enumerate(rows):
+                if i == old_count:
+                    prefix = h.hexdigest()
+                line = _line(row)
+                h.update(line)
+                whole.update(line)
+            digest = h.hexdigest()
+            if len(rows) == old_count:
+                prefix = digest
+            plan.append((section, data['module'], rows, digest, old_count if prefix == old_digest else 0))
+        digest = whole.hexdigest()
+        known = self.db.execute('SELECT digest FROM sources WHERE name = ?', (name,)).fetchone()
+        if known and known[0] == digest:
+            return 0, 0
+
+        inserted = deleted = 0
+        with self.db:
+            for section in stored.keys() - sections.keys():
+                deleted += self.db.execute('DELETE FROM ships WHERE source = ? AND section = ?',
+                                           (name, section)).rowcount
+            for section, module, rows, _, start in plan:
+                if start == 0 and stored.get(section, (0,))[0]:
+                    deleted += self.db.execute('DELETE FROM ships WHERE source = ? AND section = ?',
+                                               (name, section)).rowcount
+                self.db.executemany(
+                    'INSERT INTO ships (source, seq, section, module, name, desc, date) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    ((name, seq) + row for seq, row in enumerate(rows[start:], start)))
+                inserted += len(rows) - start
+            self.db.execute('DELETE FROM sections WHERE source = ?', (name,))
+            self.db.executemany(
+                'INSERT INTO sections (source, pos, name, module, count, digest) VALUES (?, ?, ?, ?, ?, ?)',
+                ((name, pos, section, module, len(rows), d) for pos, (section, module, rows, d, _) in enumerate(plan)))
+            self.db.execute('INSERT OR REPLACE INTO sources (name, count, digest) VALUES (?, ?, ?)',
+                            (name, sum(len(rows) for _, _, rows, _, _ in plan), digest))
+        return inserted, deleted
+
+    def sync_all(self, sources, parsed):
+        """sync() every source (generate_docs Source tuples + their sections),
+        and drop sources that no longer exist. Returns (inserted, deleted)."""
+        inserted = deleted = 0
+        for source, sections in zip(sources, parsed):
+            i, d = self.sync(source.name, sections)
+            inserted += i
+            deleted += d
+        names = [source.name for source in sources]
+        marks = ','.join('?' * len(names))
+        with self.db:
+            deleted += self.db.execute(f'DELETE FROM ships WHERE source NOT IN ({marks})', names).rowcount
+            self.db.execute(f'DELETE FROM sections WHERE source NOT IN ({marks})', names)
+            self.db.execute(f'DELETE FROM sources WHERE name NOT IN ({marks})', names)
+        return inserted, deleted
+
+    # ─── Read ──────────────────────────────────────────────────────────────
+
+    def has(self, names):
+        stored = {row[0] for row in self.db.execute('SELECT name FROM sources')}
+        return set(names) <= stored
+
+    def sections(self, name):
+        """One source's sections, shaped exactly like the parser's output."""
+        sections = {}
+        for section, module in self.db.execute('SELECT name, module FROM sections WHERE source = ? ORDER BY pos', (name,)):
+            sections[section] = {'module': module, 'items': []}
+        for section, ship, desc, when in self.db.execute(
+                'SELECT section, name, desc, date FROM ships WHERE source = ? ORDER BY section, seq', (name,)):
+            sections[section]['items'].append({'name': ship, 'desc': desc, 'date': when})
+        return sections
+
+    def query(self, section=None, module=None, since=None, until=None, text=None, count_by=None, limit=None):
+        """Ships (newest first, undated last) or, with count_by, (key, count) rows, matching every filter given."""
+        where, args = [], []
+        table = 'ships'
+        if text:
+            if self.fts:
+                table = 'ships JOIN ships_fts ON ships_fts.rowid = ships.id'
+                where.append('ships_fts MATCH ?')
+                args.append(text)
+            else:
+                where.append('(ships.name LIKE ? OR ships.desc LIKE ?)')
+                args += [f'%{text}%'] * 2
+        if section:
+            where.append("ships.section LIKE ? || '%'")
+            args.append(section)
+        if module:
+            where.append("ships.module LIKE ? || '%'")
+            args.append(module)
+        if since:
+            where.append("ships.date >= ? AND ships.date != 'unknown'")
+            args.append(since)
+        if until:
+            where.append('ships.date <= ?')
+            args.append(until)
+        sql_where = f" WHERE {' AND '.join(where)}" if where else ''
+        sql_limit = f' LIMIT {int(limit)}' if limit else ''
+        if count_by:
+            return self.db.execute(
+                f'SELECT {COUNT_BY[count_by]} AS k, count(*) FROM {table}{sql_where} '
+                f'GROUP BY k ORDER BY count(*) DESC, k{sql_limit}', args).fetchall()
+        return self.db.execute(
+            f'SELECT ships.date, ships.section, ships.module, ships.name, ships.desc FROM {table}{sql_where} '
+            f"ORDER BY ships.date = 'unknown', ships.date DESC, ships.source, ships.section, ships.seq{sql_limit}",
+            args).fetchall()
+
+
+def parse_day(text):
+    """YYYY-MM-DD, or '30d' for 30 days ago."""
+    if text and text.endswith('d') and text[:-1].isdigit():
+        return (date.today() - timedelta(days=int(text[:-1]))).isoformat()
+    return text
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Query the SQLite ship store built by generate_docs.py')
+    ap.add_argument('--db', type=Path, default=DB_PATH)
+    sub = ap.add_subparsers(dest='command', required=True)
+    q = sub.add_parser('query', help='list or count ships')
+    q.add_argument('--section', help='section name (prefix match)')
+    q.add_argument('--module', help='module path (prefix match)')
+    q.add_argument('--since', help='YYYY-MM-DD or Nd (N days ago)')
+    q.add_argument('--until', help='YYYY-MM-DD')
+    q.add_argument('--text', help='full-text search over name and description (FTS5 syntax)')
+    q.add_argument('--count-by', choices=sorted(COUNT_BY), help='count matching ships per key instead of listing them')
+    q.add_argument('--limit', type=int, default=None)
+    q.add_argument('--json', action='store_true', help='print JSON rows')
+    args = ap.parse_args(argv)
+
+    if not args.db.exists():
+        print(f'  ERROR: {args.db} not found — run generate_docs.py first')
+        return 1
+    db = ShipDB(args.db)
+    try:
+        rows = db.query(args.section, args.module, parse_day(args.since), parse_day(args.until),
+                        args.text, args.count_by, args.limit)
+    except sqlite3.OperationalError as e:
+        print(f'  ERROR: {e}')
+        return 1
+    finally:
+        db.close()
+
+    if args.json:
+        fields = ['key', 'count'] if args.count_by else ['date', 'section', 'module', 'name', 'desc']
+        print(json.dumps([dict(zip(fields, row)) for row in rows], ensure_ascii=False, indent=1))
+    elif args.count_by:
+        for key, count in rows:
+            print(f'  {count:6d}  {key}')
+    else:
+        for when, section, _, name, desc in rows:
+            print(f'  {when}  {section} — {name}: {desc}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,24 +4,49 @@
 Runs via LaunchAgent daily (and on SHIPLOG changes).
 
 1. Reads SHIPLOG.md
-2. Runs generate_docs.py
-3. Checks if anything changed
-4. If changed → commit + push
-5. Logs to bus
+2. Skips the build if no input changed since its last successful run (per the bus)
+3. Runs generate_docs.generate() in-process
+4. Takes the pages it actually wrote as the change set (or, if none, any
+   generated files still uncommitted from an earlier or manual build)
+5. If changed → records them in the deploy queue and hands off to a detached worker
+6. The worker: link check gate, one squashed commit + push (argv, no shell),
+   exponential backoff on failure; logs each deploy to the bus
 
-Run: python3 scripts/doc_sync.py
+Run: python3 scripts/doc_sync.py [--profile] [--wait]
+     python3 scripts/doc_sync.py watch [--debounce 2] [--push-interval 300]
+     python3 scripts/doc_sync.py deploy
+
+`watch` is the long-running alternative to the LaunchAgent: parse state and
+page fingerprints stay warm in memory, bursts of SHIPLOG / INFRASTRUCTURE /
+repo log edits are coalesced into one rebuild, and a worker thread pushes
+the queue at most once per interval. `deploy` drains the queue on its own.
+A stalled or failing push never holds up a build: builds only ever enqueue.
 """
 
 import subprocess
 import sys
 import os
+import signal
+import argparse
+import threading
 from pathlib import Path
 from datetime import datetime
 
+import generate_docs
+from doc_metrics import Metrics
+from doc_watch import make_watcher, settle
+from doc_bus import Bus
+from doc_deploy import DeployQueue, DeployWorker, generated_changes
+from doc_repos import REPORT as REPO_REPORT
+
 DOCS_DIR = Path.home() / "repos" / "MirrorDNA-Docs"
 SHIPLOG = Path.home() / ".mirrordna" / "SHIPLOG.md"
+INFRA = Path.home() / ".mirrordna" / "INFRASTRUCTURE.md"
 BUS_DIR = Path.home() / ".mirrordna" / "bus" / "changelog.jsonl"
 LOG_FILE = Path.home() / ".mirrordna" / "logs" / "doc_sync.log"
+# A detached `deploy` worker gives up after this many failures in a row
+# (~20 minutes of backoff); the builds stay queued for the next run.
+WORKER_ATTEMPTS = 8
 
 
 def log(msg):
@@ -36,75 +61,223 @@ def log(msg):
         pass
 
 
-def run(cmd, cwd=None):
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
-    return result.stdout.strip(), result.stderr.strip(), result.returncode
+def bus_write(event, message, metrics, started=None, deploy=None):
+    """Append one event. `started` is when the build it reports read its
+    inputs — the next run compares input mtimes against it. `deploy` is the
+    deploy worker's report (queue depth, push latency, …)."""
+    try:
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "source": "doc_sync_agent",
+            "event": event,
+            "message": message,
+            "metrics": metrics.as_dict(),
+        }
+        if started:
+            entry["started"] = started.isoformat()
+        if deploy:
+            entry["deploy"] = deploy
+        Bus(BUS_DIR).append([entry])
+    except Exception as e:
+        log(f"Bus write failed: {e}")
 
 
-def main():
-    log("⟡ Doc Sync Agent starting")
+def last_success():
+    """The bus event of this agent's last successful run (None if unknown)."""
+    try:
+        return Bus(BUS_DIR).last(lambda e: e.get("source") == "doc_sync_agent"
+                                 and e.get("event") in ("docs_updated", "docs_current"))
+    except Exception as e:
+        log(f"Bus read failed: {e}")
+        return None
 
-    # 1. Check SHIPLOG exists
-    if not SHIPLOG.exists():
-        log("ERROR: SHIPLOG.md not found")
-        sys.exit(1)
 
-    # 2. Get SHIPLOG hash to detect changes
-    shiplog_stat = os.stat(SHIPLOG)
-    log(f"SHIPLOG: {shiplog_stat.st_size} bytes, modified {datetime.fromtimestamp(shiplog_stat.st_mtime).isoformat()}")
+def inputs_mtime():
+    """Newest modification time among everything a build reads: the ship
+    logs, the generator scripts, the asset sources and the repo scan report."""
+    paths = [s.path for s in generate_docs.discover_sources()]
+    paths += Path(__file__).resolve().parent.glob("*.py")
+    paths += [DOCS_DIR / name for name in generate_docs.ASSETS.values()]
+    paths.append(REPO_REPORT)
+    return max((p.stat().st_mtime for p in paths if p.exists()), default=0.0)
 
-    # 3. Run the doc generator
-    gen_script = DOCS_DIR / "scripts" / "generate_docs.py"
-    if not gen_script.exists():
-        log("ERROR: generate_docs.py not found")
-        sys.exit(1)
 
-    stdout, stderr, rc = run(f"python3 {gen_script}", cwd=str(DOCS_DIR))
-    if rc != 0:
-        log(f"ERROR: generate_docs.py failed: {stderr}")
-        sys.exit(1)
+def _stop(signum, frame):
+    raise KeyboardInterrupt
 
-    log(f"Generator output: {stdout}")
 
-    # 4. Check git status for changes
-    stdout, _, _ = run("git diff --stat", cwd=str(DOCS_DIR))
-    if not stdout:
-        log("No changes detected — docs are current")
-        return
+def commit_message():
+    today = datetime.now().strftime("%Y-%m-%d")
+    return f"doc-sync: auto-update from SHIPLOG ({today})"
 
-    log(f"Changes detected:\n{stdout}")
 
-    # 5. Commit and push
-    today = datetime.now().strftime("%Y-%m-%d")
-    commit_msg = f"doc-sync: auto-update from SHIPLOG ({today})"
+def uncommitted_outputs(metrics):
+    """Generated files that differ from HEAD although no queued build owns
+    them — a manual generate_docs.py run, a build that died before
+    enqueueing. Only the worker commits them, so they need a queue entry."""
+    error, paths = generated_changes(DOCS_DIR, metrics)
+    if error:
+        log(f"WARNING: {error}")
+    return paths
+
+
+def on_deploy(report, metrics):
+    """Deploy worker callback: every successful deploy is a bus event, dated
+    by the newest build it shipped, with the builds' phases under build/."""
+    if report["ok"]:
+        bus_write("docs_updated", report["message"], metrics,
+                  datetime.fromisoformat(report["built_at"]), deploy=report)
+
+
+def spawn_worker():
+    """Drain the queue from a detached `deploy` process — this run is done."""
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOG_FILE, "a") as errors:
+        subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "deploy"],
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=errors,
+                         start_new_session=True)
+
+
+def watch(debounce=2.0, push_interval=300.0, poll=False):
+    """Daemon: rebuild on ship log changes; a worker thread pushes the
+    queued builds at most once per interval."""
+    # INFRASTRUCTURE.md is watched even before it exists; repo logs as found at startup
+    logs = [SHIPLOG, INFRA]
+    logs += [s.path for s in generate_docs.discover_sources() if s.path not in logs]
+    log(f"⟡ Doc Sync watching {SHIPLOG.name}, {INFRA.name} and {len(logs) - 2} repo logs "
+        f"(debounce {debounce:g}s, push every {push_interval:g}s)")
+    signal.signal(signal.SIGTERM, _stop)
 
-    _, _, rc1 = run("git add -A", cwd=str(DOCS_DIR))
-    _, stderr, rc2 = run(f'git commit -m "{commit_msg}"', cwd=str(DOCS_DIR))
-    if rc2 != 0:
-        log(f"Commit failed: {stderr}")
+    watcher = make_watcher(logs, poll=poll)
+    parser = generate_docs.ShiplogParser()
+    parser.load()
+    graph = generate_docs.BuildGraph()
+    queue = DeployQueue()
+    worker = DeployWorker(queue, DOCS_DIR, log, on_deploy)
+    wake, stop = threading.Event(), threading.Event()
+
+    def serve():
+        # A detached worker from a LaunchAgent run may hold the queue for a while
+        while not worker.run(wake, stop, push_interval):
+            stop.wait(30)
+
+    deployer = threading.Thread(target=serve, name="deploy", daemon=True)
+    deployer.start()
+    dirty = True  # build once on startup
+
+    try:
+        while True:
+            if dirty:
+                built_at = datetime.now()
+                metrics = Metrics()
+                with metrics.phase("generate"):
+                    results = generate_docs.generate(metrics=metrics, parser=parser, graph=graph)
+                if results is not None:
+                    written = {res.page.output for res in results if res.status in ("written", "removed")}
+                    if written:
+                        log(f"Rebuilt: {', '.join(sorted(written))}")
+                        queue.enqueue(written, commit_message(), built_at, metrics.as_dict())
+                        wake.set()
+                dirty = False
+
+            if watcher.wait(None):
+                settle(watcher, debounce)
+                dirty = True
+    except KeyboardInterrupt:
+        stop.set()
+        wake.set()
+        deployer.join(30)  # an in-flight push gets a moment; its builds stay queued regardless
+        depth = queue.depth()
+        if depth:
+            log(f"{depth} build(s) left in the deploy queue")
+        log("⟡ Doc Sync watch stopped")
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Regenerate MirrorDNA-Docs from SHIPLOG and deploy")
+    ap.add_argument("mode", nargs="?", choices=["once", "watch", "deploy"], default="once",
+                    help="once: single sync (LaunchAgent); watch: long-running daemon; deploy: drain the deploy queue")
+    ap.add_argument("--profile", action="store_true", help="dump cProfile/tracemalloc data for every phase")
+    ap.add_argument("--force", action="store_true", help="once: build even if no input changed since the last successful run")
+    ap.add_argument("--wait", action="store_true", help="once: deploy in this process instead of a detached worker")
+    ap.add_argument("--debounce", type=float, default=2.0, help="watch: seconds of quiet before rebuilding")
+    ap.add_argument("--push-interval", type=float, default=300.0, help="watch: minimum seconds between pushes")
+    ap.add_argument("--poll", action="store_true", help="watch: use stat() polling instead of inotify")
+    args = ap.parse_args(argv)
+
+    if args.mode == "watch":
+        watch(args.debounce, args.push_interval, args.poll)
         return
 
-    _, stderr, rc3 = run("git push", cwd=str(DOCS_DIR))
-    if rc3 != 0:
-        log(f"Push failed: {stderr}")
+    if args.mode == "deploy":
+        if not DeployWorker(DeployQueue(), DOCS_DIR, log, on_deploy).run(max_attempts=WORKER_ATTEMPTS):
+            log("Deploy worker already running")
         return
 
-    log(f"Deployed: {commit_msg}")
+    metrics = Metrics(profile=args.profile)
 
-    # 6. Write to bus
-    try:
-        import json
-        entry = {
-            "timestamp": datetime.now().isoformat(),
-            "source": "doc_sync_agent",
-            "event": "docs_updated",
-            "message": commit_msg,
-        }
-        BUS_DIR.parent.mkdir(parents=True, exist_ok=True)
-        with open(BUS_DIR, "a") as f:
-            f.write(json.dumps(entry) + "\n")
-    except Exception as e:
-        log(f"Bus write failed: {e}")
+    log("⟡ Doc Sync Agent starting")
+
+    # 1. Check SHIPLOG exists
+    if not SHIPLOG.exists():
+        log("ERROR: SHIPLOG.md not found")
+        sys.exit(1)
+
+    # 2. Nothing the build reads changed since the last successful run → done
+    shiplog_stat = os.stat(SHIPLOG)
+    log(f"SHIPLOG: {shiplog_stat.st_size} bytes, modified {datetime.fromtimestamp(shiplog_stat.st_mtime).isoformat()}")
+    queue = DeployQueue()
+    last = None if args.force else last_success()
+    stray = None
+    if last and not queue.depth():
+        last_run = datetime.fromisoformat(last.get("started", last["timestamp"]))
+        log(f"Last successful run: {last_run.isoformat()} ({last['event']})")
+        if inputs_mtime() < last_run.timestamp():
+            stray = uncommitted_outputs(metrics)
+            if not stray:
+                log("No inputs changed since then — docs are current")
+                bus_write("docs_current", "inputs unchanged since last run", metrics, last_run)
+                return
+            log(f"No inputs changed since then, but {len(stray)} generated file(s) are uncommitted")
+
+    # 3. Run the doc generator in-process — no interpreter start, no shell
+    started = datetime.now()
+    with metrics.phase("generate"):
+        results = generate_docs.generate(metrics=metrics)
+    if results is None:
+        log("ERROR: generate_docs failed")
+        sys.exit(1)
+
+    # 4. The generator reports exactly which files it rewrote
+    changed = {res.page.output for res in results if res.status in ("written", "removed")}
+    depth = queue.depth()
+    if not changed and not depth:
+        changed = set(uncommitted_outputs(metrics) if stray is None else stray)
+        if not changed:
+            log("No changes detected — docs are current")
+            bus_write("docs_current", "no changes", metrics, started)
+            return
+        log(f"Build wrote nothing, but {len(changed)} generated file(s) are uncommitted")
+
+    # 5. Record the build in the deploy queue; git happens elsewhere
+    if changed:
+        log(f"Changes detected: {', '.join(sorted(changed))}")
+        queue.enqueue(changed, commit_message(), started, metrics.as_dict())
+    else:
+        log(f"No changes detected — {depth} earlier build(s) still queued")
+
+    # 6. Commit + push: one squashed commit for everything queued
+    if args.wait:
+        with queue.worker_lock() as mine:
+            if mine:
+                DeployWorker(queue, DOCS_DIR, log, on_deploy).attempt()
+            else:
+                log("Deploy worker already running — it will pick this build up")
+    else:
+        spawn_worker()
+        log(f"Queued for deploy ({queue.depth()} build(s) in queue)")
 
     log("⟡ Doc Sync complete")
 
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+⟡ MirrorDNA Doc Watch — File watchers for the long-running doc daemons.
+
+    watcher = make_watcher([SHIPLOG, INFRA])
+    changed = watcher.wait(timeout=30)   # set of changed paths, empty on timeout
+
+Linux uses inotify (via libc, no extra packages). Everywhere else — and if
+inotify is unavailable — a stat() poller is used. Both watch the parent
+directory by name, so editors that save by rename-over are still seen.
+"""
+
+import os
+import sys
+import time
+import errno
+import ctypes
+import ctypes.util
+import select
+import struct
+from pathlib import Path
+
+POLL_INTERVAL = 1.0
+
+# inotify(7) event bits
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+_EVENT = struct.Struct('iIII')
+
+
+class PollWatcher:
+    """Portable fallback: compares (mtime, size, inode) every POLL_INTERVAL."""
+
+    def __init__(self, paths, interval=POLL_INTERVAL):
+        self.paths = [Path(p) for p in paths]
+        self.interval = interval
+        self.state = {p: self._stat(p) for p in self.paths}
+
+    @staticmethod
+    def _stat(path):
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for p in self.paths:
+                now = self._stat(p)
+                if now != self.state[p]:
+                    self.state[p] = now
+                    changed.add(p)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            step = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(step)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify on the parent directories, filtered to the watched names."""
+
+    def __init__(self, paths):
+        self.paths = [Path(p).resolve() for p in paths]
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        for parent in {p.parent for p in self.paths}:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(parent), IN_MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {parent}')
+            self.dirs[wd] = parent
+
+    def wait(self, timeout=None):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+            pos = 0
+            while pos < len(buf):
+                wd, _mask, _cookie, length = _EVENT.unpack_from(buf, pos)
+                name = buf[pos + _EVENT.size:pos + _EVENT.size + length].rstrip(b'\0')
+                pos += _EVENT.size + length
+                path = self.dirs.get(wd, Path()) / os.fsdecode(name)
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(paths, poll=False):
+    """inotify where available, stat() polling otherwise (or when poll=True)."""
+    paths = [Path(p) for p in paths]
+    if not poll and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollWatcher(paths)
+
+
+def settle(watcher, debounce, max_wait=None):
+    """Absorb a burst of events: return once nothing changed for `debounce`
+    seconds (or after `max_wait`, so a constant writer cannot starve us).
+
+    An empty wait() is not quiet by itself — inotify also wakes up for other
+    files in the watched directories — so only the clock ends the burst.
+    """
+    changed = set()
+    now = time.monotonic()
+    deadline = now + (max_wait if max_wait is not None else debounce * 10)
+    quiet_at = now + debounce
+    while True:
+        now = time.monotonic()
+        remaining = min(quiet_at, deadline) - now
+        if remaining <= 0:
+            return changed
+        more = watcher.wait(remaining)
+        if more:
+            changed |= more
+            quiet_at = time.monotonic() + debounce
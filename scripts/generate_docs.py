@@ -1,13 +1,36 @@
 #!/usr/bin/env python3
 """
-⟡ MirrorDNA Doc Generator — Reads SHIPLOG.md → Updates MirrorDNA-Docs HTML pages.
+⟡ MirrorDNA Doc Generator — Reads SHIPLOG.md (plus INFRASTRUCTURE.md and
+per-repo ship logs) → Updates MirrorDNA-Docs HTML pages, the Atom/JSON
+feeds, the Docusaurus status page (website/docs/status/shiplog.md) and llms.txt.
 Run: python3 scripts/generate_docs.py
 """
 
 import re
 import os
+import json
+import sys
+import hashlib
+import argparse
+import time
+import heapq
+from string import Formatter
+from collections import namedtuple
+from collections.abc import Mapping
+from itertools import groupby
+from operator import attrgetter
+from functools import lru_cache, partial
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from xml.sax.saxutils import escape as xml_escape
+
+from doc_metrics import Metrics
+from doc_assets import ASSETS, SIBLINGS, fingerprint_assets, hashed_glob, minify_html, precompress
+from doc_output import BuildLock, Staging
+from doc_repos import REPO_DEFAULTS, repo_stats
+from doc_store import ShipDB
 
 SHIPLOG = Path.home() / ".mirrordna" / "SHIPLOG.md"
 INFRA = Path.home() / ".mirrordna" / "INFRASTRUCTURE.md"
@@ -15,64 +38,688 @@ DOCS_DIR = Path.home() / "repos" / "MirrorDNA-Docs"
 
 # ─── Parse SHIPLOG ────────────────────────────────────────────────────────────
 
-def parse_shiplog():
-    """Parse SHIPLOG.md into structured data."""
-    text = SHIPLOG.read_text()
-    sections = {}
-    current_section = None
-    current_module = None
-    items = []
-
-    for line in text.split('\n'):
-        if line.startswith('## '):
-            if current_section and items:
-                sections[current_section] = {'module': current_module, 'items': items}
-            current_section = line[3:].strip()
-            current_module = None
-            items = []
-        elif line.startswith('> Module:'):
-            current_module = line.split('`')[1] if '`' in line else line
-        elif line.startswith('- **'):
-            # Extract: name, description, date — handle both — and : separators
-            m = re.match(r'- \*\*(.+?)\*\*\s*(?:\([^)]*\))?\s*[—:]\s*(.+?)(?:\s*`SHIPPED (\d{4}-\d{2}-\d{2})`)?$', line)
-            if m:
+CACHE_DIR = Path.home() / ".mirrordna" / "cache"
+CHECKPOINT = CACHE_DIR / "shiplog_checkpoint.json"
+CHECKPOINT_VERSION = 3
+
+# Single-pass line classifier, run with finditer over the whole buffer. Each
+# SHIPLOG line that carries data matches exactly one branch; everything else
+# (prose, `- Location:` / `- Spec:` metadata) is skipped by the regex engine.
+# Item lines: name, description — handle both — and : separators. The optional
+# trailing `SHIPPED YYYY-MM-DD` tag is peeled off in split_shipped() rather
+# than by a lazy (.+?) that re-tries the tag at every character.
+# [^\S\n] is "whitespace within the line", so no branch can run past a newline.
+SHIPLOG_TOKENS = re.compile(r'''
+    ^(?:
+        \#\#\ (?P<section>[^\n]*)
+      | (?P<module>>\ Module:[^\n]*)
+      | -\ \*\*(?P<name>.+?)\*\*[^\S\n]*(?:\([^)\n]*\))?[^\S\n]*[—:][^\S\n]*(?P<desc>[^\n]+)
+      | -\ SHIPPED:[^\n]*?(?P<shipped>\d{4}-\d{2}-\d{2})
+    )
+''', re.MULTILINE | re.VERBOSE)
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+SHIPPED_TAG = '`SHIPPED '  # + YYYY-MM-DD + ` — 20 chars in all
+
+
+def split_shipped(desc):
+    """Split a trailing `SHIPPED YYYY-MM-DD` tag off an item description.
+
+    Returns (desc, date or None). A tag with nothing before it stays part of
+    the description, as it always has.
+    """
+    n = len(desc)
+    if desc.endswith('`') and desc[-20:-11] == SHIPPED_TAG and ISO_DATE.fullmatch(desc, n - 11, n - 1):
+        head = desc[:-20].rstrip()
+        if head:
+            return head, desc[-11:-1]
+    return desc, None
+
+
+class Sections(Mapping):
+    """A parse result: section → {'module', 'items'}, in log order.
+
+    Sections the parser closed in an earlier run stay in its record file
+    until one is looked up; each is decoded on first use and then cached
+    by the parser, so a run that only appended lines decodes nothing old.
+
+    tokens[name] identifies a closed section's content: the parser hands
+    out a new one whenever it closes a section and a new generation on every
+    full re-parse, so an unchanged token means an unchanged section. The
+    open section has none.
+    """
+
+    def __init__(self, index, records, cache, tokens=None):
+        self._index = index      # name → section dict, or (offset, length) in `records`
+        self._records = records
+        self._cache = cache      # offset → decoded section, shared with the parser
+        self._blob = None
+        self.tokens = tokens or {}
+
+    def __getitem__(self, name):
+        loc = self._index[name]
+        if isinstance(loc, dict):
+            return loc
+        data = self._cache.get(loc[0])
+        if data is None:
+            if self._blob is None:
+                self._blob = self._records.read_bytes()
+            data = self._cache[loc[0]] = json.loads(self._blob[loc[0]:loc[0] + loc[1]])
+        return data
+
+    def __contains__(self, name):
+        return name in self._index  # without decoding it
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __reduce__(self):
+        # Decoded in full: the record file stays behind in the worker process
+        return Sections, (dict(self.items()), None, {}, self.tokens)
+
+
+class ShiplogParser:
+    """Resumable SHIPLOG parser.
+
+    SHIPLOG is append-only in practice, so the parser remembers how far it got
+    (byte offset of the last complete line), the section/module that was still
+    open there, and a SHA-256 of everything before that offset. The next run
+    only parses the appended tail; if the prefix hash no longer matches (an
+    edit above the checkpoint), it starts over with a full parse.
+
+    Closed sections are not part of the checkpoint: save() appends each newly
+    closed one as a JSON line to a record file next to it, and the checkpoint
+    keeps just their (offset, length). Loading is O(sections), not O(items),
+    and old sections are only decoded when the result is read. Each closed
+    section also keeps the serial it was closed under (see Sections.tokens).
+    """
+
+    def __init__(self, path=SHIPLOG, checkpoint=CHECKPOINT):
+        self.path = Path(path)
+        self.checkpoint = Path(checkpoint) if checkpoint else None
+        self.records = self.checkpoint.with_suffix('.sections.jsonl') if checkpoint else None
+        self.reset()
+
+    def reset(self):
+        self.offset = 0
+        self.sha256 = hashlib.sha256().hexdigest()
+        self.closed = {}         # section → dict (not yet saved) or [offset, length] in self.records
+        self.section = None
+        self.module = None
+        self.items = []
+        self.records_size = 0    # bytes of self.records the checkpoint vouches for
+        self.generation = os.urandom(6).hex()
+        self.serial = 0          # sections closed in this generation
+        self.serials = {}        # section → serial it was last closed under
+        self._cache = {}
+
+    def load(self):
+        """Restore state from the checkpoint file. Returns True on success."""
+        if not self.checkpoint or not self.checkpoint.exists():
+            return False
+        try:
+            state = json.loads(self.checkpoint.read_text())
+            records_size = self.records.stat().st_size if state.get('records_size') else 0
+        except (OSError, ValueError):
+            return False
+        if (state.get('version') != CHECKPOINT_VERSION or state.get('path') != str(self.path)
+                or records_size < state['records_size']):
+            return False
+        self.reset()
+        self.offset = state['offset']
+        self.sha256 = state['sha256']
+        self.closed = {name: (offset, length) for name, offset, length, _ in state['index']}
+        self.serials = {name: serial for name, _, _, serial in state['index']}
+        self.generation = state['generation']
+        self.serial = state['serial']
+        self.section = state['section']
+        self.module = state['module']
+        self.items = state['items']
+        self.records_size = state['records_size']
+        return True
+
+    def save(self):
+        if not self.checkpoint:
+            return
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        # Records past records_size were appended by a save that never got to
+        # write its checkpoint (or belong to a log that was re-parsed): drop them
+        with open(self.records, 'ab') as f:
+            f.truncate(self.records_size)
+            pos = self.records_size
+            for name, data in self.closed.items():
+                if isinstance(data, dict):
+                    line = json.dumps(data, ensure_ascii=False).encode() + b'\n'
+                    f.write(line)
+                    self._cache[pos] = data
+                    self.closed[name] = (pos, len(line))
+                    pos += len(line)
+        self.records_size = pos
+        state = {
+            'version': CHECKPOINT_VERSION,
+            'path': str(self.path),
+            'offset': self.offset,
+            'sha256': self.sha256,
+            'section': self.section,
+            'module': self.module,
+            'items': self.items,
+            'records_size': self.records_size,
+            'generation': self.generation,
+            'serial': self.serial,
+            'index': [[name, *loc, self.serials[name]] for name, loc in self.closed.items()],
+        }
+        tmp = self.checkpoint.with_suffix('.tmp')
+        tmp.write_text(json.dumps(state, ensure_ascii=False))
+        os.replace(tmp, self.checkpoint)
+
+    def feed(self, text):
+        """Advance the parser state over complete SHIPLOG lines."""
+        closed, serials = self.closed, self.serials
+        section, module, items = self.section, self.module, self.items
+        for m in SHIPLOG_TOKENS.finditer(text):
+            heading, module_line, name, desc, shipped = m.groups()
+            if name is not None:
+                shipped = None
+                if desc[-1] == '`':
+                    desc, shipped = split_shipped(desc)
                 items.append({
-                    'name': m.group(1),
-                    'desc': m.group(2).strip().rstrip('`').strip(),
-                    'date': m.group(3) or 'unknown',
+                    'name': name,
+                    'desc': desc.strip().rstrip('`').strip(),
+                    'date': shipped or 'unknown',
                 })
-        elif line.startswith('- Location:') or line.startswith('- Spec:') or line.startswith('- SHIPPED:'):
-            # Metadata lines for section-level items
-            if items and line.startswith('- SHIPPED:'):
-                d = re.search(r'(\d{4}-\d{2}-\d{2})', line)
-                if d and items[-1]['date'] == 'unknown':
-                    items[-1]['date'] = d.group(1)
+            elif heading is not None:
+                if section and items:
+                    closed[section] = {'module': module, 'items': items}
+                    self.serial += 1
+                    serials[section] = self.serial
+                section = heading.strip()
+                module = None
+                items = []
+            elif module_line is not None:
+                module = module_line.split('`')[1] if '`' in module_line else module_line
+            elif items and items[-1]['date'] == 'unknown':
+                # `- SHIPPED: <date>` metadata line for a section-level item
+                items[-1]['date'] = shipped
+        self.section, self.module, self.items = section, module, items
+
+    def result(self, pending=''):
+        """Sections parsed so far, with the open section (and any unterminated
+        trailing line in `pending`) folded in, without disturbing the state."""
+        view = ShiplogParser(self.path, None)
+        view.closed = dict(self.closed)
+        view.serials = dict(self.serials)
+        view.serial = self.serial
+        view.section = self.section
+        view.module = self.module
+        view.items = [dict(it) for it in self.items]
+        if pending:
+            view.feed(pending)
+        if view.section and view.items:
+            view.closed[view.section] = {'module': view.module, 'items': view.items}
+            view.serials.pop(view.section, None)
+        # Sections closed by the unterminated line are provisional: no token
+        tokens = {name: f'{self.generation}:{serial}'
+                  for name, serial in view.serials.items() if serial <= self.serial}
+        return Sections(view.closed, self.records, self._cache, tokens)
+
+    def parse(self):
+        """Parse whatever was appended since the checkpoint and return sections."""
+        data = self.path.read_bytes()
+        prefix = hashlib.sha256(data[:self.offset])
+        if self.offset > len(data) or prefix.hexdigest() != self.sha256:
+            self.reset()
+            prefix = hashlib.sha256()
+
+        # Only complete lines advance the checkpoint; a half-written last line
+        # is parsed for this run's result but re-read next time.
+        end = data.rfind(b'\n', self.offset) + 1
+        if end > self.offset:
+            tail = data[self.offset:end]
+            self.feed(_decode(tail))
+            prefix.update(tail)
+            self.offset = end
+            self.sha256 = prefix.hexdigest()
+
+        return self.result(_decode(data[self.offset:]))
+
+
+def _decode(data):
+    # Same newline handling as Path.read_text(): \r\n and lone \r become \n
+    return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def parse_shiplog(path=SHIPLOG, checkpoint=CHECKPOINT):
+    """Parse SHIPLOG.md into structured data.
+
+    With a checkpoint, only the lines appended since the previous run are
+    parsed. Pass checkpoint=None for a stateless full parse.
+    """
+    parser = ShiplogParser(path, checkpoint)
+    resumed = parser.load()
+    start = (parser.offset, parser.sha256)
+    sections = parser.parse()
+    if not resumed or (parser.offset, parser.sha256) != start:
+        parser.save()
+    return sections
 
-    if current_section and items:
-        sections[current_section] = {'module': current_module, 'items': items}
 
+# ─── Sources ──────────────────────────────────────────────────────────────────
+
+# Every ship log is markdown in the SHIPLOG format. Each source is parsed on
+# its own (with its own checkpoint) and adapted into the common section model;
+# ShipStore merges the results.
+REPOS_DIR = Path.home() / "repos"
+REPO_LOG = "SHIPLOG.md"
+SOURCE_CHECKPOINTS = CACHE_DIR / "sources"
+
+# name: unique id · path: the log · checkpoint: parser state file ·
+# section: file every item under this one section (None = the log's own
+# headings) · module: default for sections without a `> Module:` line
+Source = namedtuple('Source', 'name path checkpoint section module')
+
+
+def discover_sources():
+    """SHIPLOG first, then INFRASTRUCTURE.md and every ~/repos/*/SHIPLOG.md that exists."""
+    sources = [Source('shiplog', SHIPLOG, CHECKPOINT, None, None)]
+    if INFRA.exists():
+        sources.append(Source('infrastructure', INFRA, SOURCE_CHECKPOINTS / 'infrastructure.json', 'INFRASTRUCTURE', None))
+    for log in sorted(REPOS_DIR.glob(f'*/{REPO_LOG}')):
+        repo = log.parent.name
+        sources.append(Source(f'repo:{repo}', log, SOURCE_CHECKPOINTS / f'repo-{repo}.json', None, f'~/repos/{repo}'))
+    return sources
+
+
+def adapt(source, sections):
+    """Map one log's parsed sections onto the common model."""
+    if source.section:
+        items = [it for data in sections.values() for it in data['items']]
+        return {source.section: {'module': source.module, 'items': items}} if items else {}
+    if source.module:
+        return Sections({name: {'module': data['module'] or source.module, 'items': data['items']}
+                         for name, data in sections.items()}, None, {}, sections.tokens)
     return sections
 
 
-def get_ship_dates(sections):
-    """Get all ship dates for timeline."""
-    dates = {}
-    for section, data in sections.items():
-        for item in data['items']:
-            d = item['date']
-            if d != 'unknown':
-                dates.setdefault(d, []).append({'section': section, **item})
-    return dict(sorted(dates.items()))
+def parse_source(source, parser=None):
+    """Parse one source (resuming from its checkpoint) into adapted sections.
+
+    A long-running caller may pass the source's warm `parser`.
+    """
+    if parser is None:
+        return adapt(source, parse_shiplog(source.path, source.checkpoint))
+    start = parser.offset
+    sections = parser.parse()
+    if parser.offset != start:
+        parser.save()
+    return adapt(source, sections)
+
+
+def parse_sources(sources, jobs=None, processes=False, parsers=None):
+    """Parse all sources concurrently. Returns their sections, in source order.
+
+    `parsers` maps source name → warm ShiplogParser; those sources are parsed
+    in this process.
+    """
+    parsers = parsers or {}
+    if len(sources) == 1:
+        return [parse_source(sources[0], parsers.get(sources[0].name))]
+    if processes:
+        pool = ProcessPoolExecutor(jobs)
+    else:
+        pool = ThreadPoolExecutor(jobs or min(len(sources), (os.cpu_count() or 1) + 4))
+    with pool:
+        cold = {s.name: pool.submit(parse_source, s) for s in sources if s.name not in parsers}
+        warm = {s.name: parse_source(s, parsers[s.name]) for s in sources if s.name in parsers}
+        return [warm[s.name] if s.name in warm else cold[s.name].result() for s in sources]
+
+
+# ─── Ship Store ───────────────────────────────────────────────────────────────
+
+# Capability layers — each groups the SHIPLOG section names (aliases included)
+# that feed it. Covers ALL SHIPLOG sections.
+CATEGORIES = {
+    'Security & Safety': {
+        'icon': '🛡️',
+        'desc': 'Defense-in-depth architecture. Kavach scam shield. Chetana deepfake detection. Fail-closed by default.',
+        'sections': ['Kavach', 'Kavach / Chetana', 'Kavach/Chetana'],
+    },
+    'Intelligence & Inference': {
+        'icon': '◈',
+        'desc': 'Multi-model orchestration with sovereign routing. Swarm intelligence. Research monitoring.',
+        'sections': ['MirrorSwarm Orchestration Engine', 'MirrorSwarm Terminal Spawner', 'Intelligence'],
+    },
+    'Memory & Identity': {
+        'icon': '⧉',
+        'desc': 'Persistent state across sessions. Memory lifecycle. Vault integrity. Continuity bus.',
+        'sections': ['Continuity System (this file)', 'Vault Organization'],
+    },
+    'Consumer Products': {
+        'icon': '⟡',
+        'desc': 'User-facing products built on sovereign infrastructure.',
+        'sections': ['ActiveMirror Site', 'Active Mirror Site', 'ActiveMirrorOS'],
+    },
+    'Infrastructure & Automation': {
+        'icon': '⚙',
+        'desc': 'Self-healing infrastructure. 24 managed services. Phone sync. Domain monitoring. Auto-backup.',
+        'sections': ['Factory Trigger', 'Cognitive Dashboard', 'Dashboard', 'INFRASTRUCTURE',
+                     'Infrastructure', 'MirrorDNA Infrastructure', 'Swarm Automation'],
+    },
+    'Publishing & Distribution': {
+        'icon': '📡',
+        'desc': 'Multi-platform publishing. Auto-synthesized beacon. 6 distribution channels.',
+        'sections': ['MirrorPublish', 'MirrorPublish Content', 'Beacon Auto-Publish', 'Publications', 'MirrorRadar'],
+    },
+    'Sovereign Factory': {
+        'icon': '🏭',
+        'desc': 'Multi-agent manufacturing pipeline. Voice-triggered. BenQ grid visualization.',
+        'sections': ['Sovereign Factory', 'Swarm Choreography Pattern'],
+    },
+}
+
+KAVACH_SECTIONS = CATEGORIES['Security & Safety']['sections']
+SECTION_CATEGORY = {section: name for name, cat in CATEGORIES.items() for section in cat['sections']}
+INFRA_SECTIONS = ['Infrastructure', 'MirrorDNA Infrastructure']
+
+
+class Ship:
+    """One shipped item. Slotted, with interned section/module/date strings —
+    years of history is mostly these."""
+
+    __slots__ = ('name', 'desc', 'date', 'section', 'module')
+
+    def __init__(self, name, desc, date, section, module):
+        self.name = name
+        self.desc = desc
+        self.date = date
+        self.section = section
+        self.module = module
+
+    def __reduce__(self):
+        return Ship, (self.name, self.desc, self.date, self.section, self.module)
+
+    def key(self):
+        return (self.section, self.name, self.desc, self.date)
+
+
+class ShipStore:
+    """Read-only ship model built once per parse and shared by every renderer.
+
+    Built from one sections dict per source. Sections of the same name are
+    merged in source order; each source's dated ships form one date-sorted
+    stream and the streams are k-way merged, so adding a source never means
+    re-sorting the whole estate.
+
+    by_section: section → tuple of Ships (SHIPLOG order)
+    by_date:    date → tuple of Ships, dates ascending ('unknown' excluded)
+    by_month:   'YYYY-MM' → {date: tuple of Ships}
+    by_category: CATEGORIES name → tuple of Ships (alias sections merged)
+    stats:       headline numbers for the templates (see Aggregates)
+    """
+
+    def __init__(self, *sources):
+        intern = sys.intern
+        self.modules = {}
+        by_section = {}
+        streams = []
+        for sections in sources:
+            dated = []
+            for section, data in sections.items():
+                section = intern(section)
+                module = intern(data['module']) if data['module'] else None
+                ships = [
+                    Ship(it['name'], it['desc'], intern(it['date']), section, module)
+                    for it in data['items']
+                ]
+                if not self.modules.get(section):
+                    self.modules[section] = module
+                by_section.setdefault(section, []).extend(ships)
+                dated.extend(ship for ship in ships if ship.date != 'unknown')
+            dated.sort(key=attrgetter('date'))  # stable; near-linear for append-only logs
+            streams.append(dated)
+        self.by_section = {name: tuple(ships) for name, ships in by_section.items()}
+
+        self.by_date = {
+            d: tuple(ships)
+            for d, ships in groupby(heapq.merge(*streams, key=attrgetter('date')), key=attrgetter('date'))
+        }
+        self.by_month = {}
+        for d, ships in self.by_date.items():
+            self.by_month.setdefault(d[:7], {})[d] = ships
+        self.by_category = {name: self.items_in(cat['sections']) for name, cat in CATEGORIES.items()}
+        self.total = sum(len(ships) for ships in self.by_section.values())
+        self.latest = next(reversed(self.by_date), None)
+        self._stats = None
+
+    def items_in(self, section_names):
+        """Ships of the named sections, concatenated in the order given."""
+        return tuple(ship for name in section_names for ship in self.by_section.get(name, ()))
+
+    def __len__(self):
+        return len(self.by_section)
+
+    @property
+    def stats(self):
+        """Headline numbers for the templates: the build's persisted
+        aggregates when it set them, else computed from this store."""
+        if self._stats is None:
+            sections = {name: {'items': [{'name': s.name, 'desc': s.desc, 'date': s.date} for s in ships]}
+                        for name, ships in self.by_section.items()}
+            self._stats = Aggregates(None).update([('store', sections)]).stats()
+        return self._stats
+
+    @stats.setter
+    def stats(self, value):
+        self._stats = value
+
+
+# ─── Aggregates ───────────────────────────────────────────────────────────────
+
+# Counters behind the headline numbers, kept per source and updated from the
+# items a parse appended — never by recounting the history. The parser says
+# which sections it has not touched since they were counted (Sections.tokens);
+# those are skipped outright. The rest — the open section, newly closed ones —
+# are hashed: if each only grew (its first count items hash as they did last
+# time) the source contributes just its new items; any other source is
+# subtracted and recounted on its own. --full recounts everything.
+AGGREGATES = CACHE_DIR / "aggregates.json"
+AGGREGATES_VERSION = 3
+COUNTERS = ('section', 'category', 'day', 'week', 'month', 'day_category')
+STATS_WINDOWS = (7, 30)
+STATS_WEEKS = 12
+# Numbers the logs cannot tell us, kept in one place
+SITE_FACTS = {'layers': 9, 'control_plane_lines': 12096}
+
+
+def iso_week(day):
+    year, week, _ = date.fromisoformat(day).isocalendar()
+    return f'{year}-W{week:02d}'
+
+
+def _digests(items, count):
+    """SHA-256 over the first `count` items (None if there are fewer) and over all of them."""
+    h = hashlib.sha256()
+    prefix = None
+    for i, item in enumerate(items):
+        if i == count:
+            prefix = h.hexdigest()
+        h.update(f"{item['name']}\x1f{item['desc']}\x1f{item['date']}\x1e".encode())
+    digest = h.hexdigest()
+    return (digest if len(items) == count else prefix), digest
+
+
+class Aggregates:
+    """Ship counters per section, category, day, ISO week and month.
+
+    seen[source] = {section: [items counted, their digest, parser token]} is
+    what makes updates incremental; counts[source] are that source's counters
+    and totals their sum.
+    """
+
+    def __init__(self, path=AGGREGATES, fresh=False):
+        self.path = Path(path) if path else None
+        self.seen = {}
+        self.counts = {}
+        self.totals = {name: {} for name in COUNTERS}
+        self.rebuilt = []
+        if self.path and self.path.exists() and not fresh:
+            try:
+                state = json.loads(self.path.read_text())
+            except ValueError:
+                state = {}
+            if state.get('version') == AGGREGATES_VERSION:
+                self.seen, self.counts, self.totals = state['seen'], state['counts'], state['totals']
+
+    @staticmethod
+    def _bump(counters, section, item, sign=1):
+        keys = {'section': section}
+        category = SECTION_CATEGORY.get(section)
+        if category:
+            keys['category'] = category
+        d = item['date']
+        try:
+            week = None if d == 'unknown' else iso_week(d)
+        except ValueError:  # not a calendar date (2026-02-30): counted, but undated
+            week = None
+        if week:
+            keys.update(day=d, week=week, month=d[:7])
+            if category:
+                keys['day_category'] = f'{d}|{category}'
+        for name, key in keys.items():
+            counter = counters[name]
+            counter[key] = counter.get(key, 0) + sign
+
+    def _merge(self, counts, sign):
+        for name, counter in counts.items():
+            total = self.totals[name]
+            for key, n in counter.items():
+                n = total.get(key, 0) + sign * n
+                if n:
+                    total[key] = n
+                else:
+                    total.pop(key, None)
+
+    def update(self, sources):
+        """Count what is new in each (name, {section: {'items': [...]}}) source. Returns self."""
+        names = set()
+        for name, sections in sources:
+            names.add(name)
+            seen = self.seen.get(name, {})
+            tokens = getattr(sections, 'tokens', {})
+            now = {}
+            fresh = {}  # section → (items, how many were counted before)
+            appended = name in self.counts and seen.keys() <= sections.keys()
+            for section in sections:
+                token, old = tokens.get(section), seen.get(section)
+                if token and old and old[2] == token:
+                    now[section] = old  # untouched since it was counted
+                    continue
+                items = sections[section]['items']
+                count = old[0] if old else 0
+                prefix, digest = _digests(items, count)
+                if old and prefix != old[1]:
+                    appended = False
+                now[section] = [len(items), digest, token]
+                fresh[section] = (items, count)
+            if appended:
+                delta = {c: {} for c in COUNTERS}
+                for section, (items, count) in fresh.items():
+                    for item in items[count:]:
+                        self._bump(delta, section, item)
+                for c, counter in delta.items():
+                    mine = self.counts[name][c]
+                    for key, n in counter.items():
+                        mine[key] = mine.get(key, 0) + n
+                self._merge(delta, 1)
+            else:
+                if name in self.counts:
+                    self._merge(self.counts[name], -1)
+                    self.rebuilt.append(name)
+                self.counts[name] = {c: {} for c in COUNTERS}
+                for section, data in sections.items():
+                    for item in data['items']:
+                        self._bump(self.counts[name], section, item)
+                self._merge(self.counts[name], 1)
+            self.seen[name] = now
+        for name in set(self.counts) - names:  # a source that went away
+            self._merge(self.counts.pop(name), -1)
+            self.seen.pop(name, None)
+        return self
+
+    def update_parsed(self, sources, parsed):
+        """update() from discover_sources() + parse_sources() output."""
+        return self.update(zip((source.name for source in sources), parsed))
+
+    def stats(self, extra=None):
+        """The template-facing view: totals, rolling windows, recent weeks."""
+        t = self.totals
+        days = t['day']
+        latest = max(days) if days else None
+        first = min(days) if days else None
+        stats = {
+            'total': sum(t['section'].values()),
+            'sections': len({s for seen in self.seen.values() for s in seen}),
+            'active_days': len(days),
+            'first': first,
+            'latest': latest,
+            'months': 0,
+            'per_category': dict(t['category']),
+            'weeks': [],
+        }
+        if latest:
+            end, start = date.fromisoformat(latest), date.fromisoformat(first)
+            stats['months'] = (end.year - start.year) * 12 + end.month - start.month + 1
+            for n in STATS_WINDOWS:
+                window = [(end - timedelta(days=i)).isoformat() for i in range(n)]
+                stats[f'last_{n}'] = sum(days.get(d, 0) for d in window)
+                stats[f'per_category_{n}'] = {
+                    cat: total for cat in CATEGORIES
+                    if (total := sum(t['day_category'].get(f'{d}|{cat}', 0) for d in window))}
+            weeks = sorted(t['week'])[-STATS_WEEKS:]
+            stats['weeks'] = [[week, t['week'][week]] for week in weeks]
+        else:
+            for n in STATS_WINDOWS:
+                stats[f'last_{n}'] = 0
+                stats[f'per_category_{n}'] = {}
+        stats.update(SITE_FACTS)
+        stats.update(extra or REPO_DEFAULTS)
+        return stats
+
+    def save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        tmp.write_text(json.dumps({'version': AGGREGATES_VERSION, 'seen': self.seen,
+                                   'counts': self.counts, 'totals': self.totals}, ensure_ascii=False))
+        os.replace(tmp, self.path)
+
 
+# ─── HTML Template Helpers ────────────────────────────────────────────────────
 
-def count_ships(sections):
-    total = sum(len(d['items']) for d in sections.values())
-    return total
+class Template:
+    """A str.format()-style template split into literal text and field names
+    once, up front. Filling it in is a flat walk over the parts — no format
+    string is re-parsed per page or per card."""
 
+    def __init__(self, text):
+        self.parts = [(literal, field) for literal, field, _, _ in Formatter().parse(text)]
 
-# ─── HTML Template Helpers ────────────────────────────────────────────────────
+    def chunks(self, **fields):
+        for literal, field in self.parts:
+            if literal:
+                yield literal
+            if field is not None:
+                yield str(fields[field])
+
+    def __call__(self, **fields):
+        return ''.join(self.chunks(**fields))
 
-NAV_TEMPLATE = '''    <nav class="nav">
+
+NAV_PAGES = ['story', 'principles', 'architecture', 'security', 'capabilities', 'activemirror', 'research', 'ecosystem']
+
+NAV_TEMPLATE = Template('''    <nav class="nav">
         <div class="nav-inner">
             <a href="./" class="nav-logo">
                 <span class="nav-logo-glyph">⟡</span>
@@ -91,17 +738,20 @@ NAV_TEMPLATE = '''    <nav class="nav">
                 <li><a href="ecosystem/"{ecosystem_active}>Ecosystem</a></li>
             </ul>
         </div>
-    </nav>'''
+    </nav>''')
+
+# One finished nav bar per active page, built once per run
+NAVS = {
+    active: NAV_TEMPLATE(**{f'{p}_active': ' class="active"' if p == active else '' for p in NAV_PAGES})
+    for active in [''] + NAV_PAGES
+}
+
 
 def nav(active=''):
-    pages = ['story','principles','architecture','security','capabilities','activemirror','research','ecosystem']
-    attrs = {}
-    for p in pages:
-        attrs[f'{p}_active'] = ' class="active"' if p == active else ''
-    return NAV_TEMPLATE.format(**attrs)
+    return NAVS[active]
 
 
-HEAD = '''<!DOCTYPE html>
+HEAD = Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -110,105 +760,389 @@ HEAD = '''<!DOCTYPE html>
     <title>{title}</title>
     <meta name="description" content="{desc}">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="styles.css">
-    <link rel="icon" type="image/svg+xml" href="favicon.svg">
-</head>'''
+    <link rel="stylesheet" href="{styles}">
+    <link rel="icon" type="image/svg+xml" href="{favicon}">
+    <link rel="alternate" type="application/atom+xml" title="MirrorDNA — Shipped" href="feed.xml">
+</head>''')
+
+# HEAD asset field → URL; the asset stage swaps in the fingerprinted names
+ASSET_URLS = dict(ASSETS)
+ASSET_MARKS = {'written': '✓', 'unchanged': '=', 'removed': '✗'}
+# Minify HTML, fingerprint assets and precompress outputs (--no-assets turns it off)
+ASSET_STAGE = True
+
 
-FOOTER = '''
+def head(title, desc):
+    return HEAD(title=title, desc=desc, **ASSET_URLS)
+
+FOOTER = Template('''
     <footer class="footer">
         <div class="container">
             <p>⟡ MirrorDNA — Sovereign AI Infrastructure</p>
             <p style="margin-top: 0.5rem; color: var(--text-muted); font-size: 0.8rem;">
-                N1 Intelligence · {year} · Auto-generated from SHIPLOG on {date}
+                N1 Intelligence · {year} · Auto-generated from SHIPLOG {stamp}
             </p>
         </div>
     </footer>
 </main>
 </body>
-</html>'''
+</html>''')
+
+# 'stable' stamps the latest ship date so unchanged SHIPLOG → byte-identical
+# pages; 'today' stamps the build date (rewrites every page every day).
+FOOTER_MODE = 'stable'
+
 
-def footer():
-    return FOOTER.format(year=date.today().year, date=date.today().isoformat())
+@lru_cache(maxsize=None)
+def _footer(year, stamp):
+    return FOOTER(year=year, stamp=stamp)
 
 
-def capability_card(name, desc, icon='⟡'):
-    return f'''                <div class="capability-card">
+def footer(store, latest=None):
+    """Page footer. In stable mode the stamp is `latest` (default: the newest
+    ship date in the store), so it only changes when the content does."""
+    if FOOTER_MODE == 'stable':
+        latest = latest or store.latest
+    else:
+        latest = None
+    if latest:
+        return _footer(latest[:4], f'· latest ship {latest}')
+    today = date.today()
+    return _footer(str(today.year), f'on {today.isoformat()}')
+
+
+CARD = Template('''                <div class="capability-card">
                     <div class="capability-header">
                         <span class="capability-icon">{icon}</span>
                         <h4>{name}</h4>
                     </div>
                     <p>{desc}</p>
-                </div>'''
+                </div>''')
+
+
+def capability_cards(items, icon='⟡'):
+    """Chunks for a run of capability cards, newline-separated."""
+    sep = ''
+    for it in items:
+        if sep:
+            yield sep
+        yield from CARD.chunks(icon=icon, name=it.name, desc=it.desc)
+        sep = '\n'
+
+
+# ─── Build Graph ──────────────────────────────────────────────────────────────
+
+# Bump whenever the HTML templates change so every page is rebuilt once.
+TEMPLATE_VERSION = 6
+BUILD_GRAPH = CACHE_DIR / "build_graph.json"
+
+
+
+class BuildGraph:
+    """Remembers what each output page was built from.
+
+    A page is rebuilt only when the template version, the footer mode or one
+    of the inputs it declares changed since the last build. Pages declaring
+    section names (or None for all) also depend on the latest ship date,
+    which their footer shows; pages declaring a callable depend on exactly
+    what it returns.
+    """
+
+    def __init__(self, path=BUILD_GRAPH):
+        self.path = Path(path) if path else None
+        self.pages = {}
+        if self.path and self.path.exists():
+            try:
+                self.pages = json.loads(self.path.read_text())
+            except ValueError:
+                self.pages = {}
+        self._inputs = None
+
+    def digests(self, store):
+        """Per-section digests, computed once per store."""
+        if self._inputs is None or self._inputs[0] is not store:
+            digests = {
+                name: hashlib.sha256(json.dumps(
+                    [store.modules[name], [ship.key() for ship in ships]], ensure_ascii=False
+                ).encode()).hexdigest()
+                for name, ships in store.by_section.items()
+            }
+            self._inputs = (store, digests)
+        return self._inputs[1]
+
+    def fingerprint(self, page, store):
+        if callable(page.inputs):
+            names, deps = [], page.inputs(store)
+        else:
+            digests = self.digests(store)
+            names = list(digests) if page.inputs is None else [n for n in page.inputs if n in digests]
+            deps = {'sections': [(n, digests[n]) for n in names], 'latest': store.latest}
+        key = json.dumps({
+            'template': TEMPLATE_VERSION,
+            'facts': SITE_FACTS,
+            'footer': FOOTER_MODE if FOOTER_MODE == 'stable' else date.today().isoformat(),
+            'assets': ASSET_URLS if ASSET_STAGE else None,
+            'deps': deps,
+        }, sort_keys=True)
+        return hashlib.sha256(key.encode()).hexdigest(), names
+
+    def fresh(self, page, store, root=None):
+        entry = self.pages.get(page.output)
+        if not entry or not (Path(root or DOCS_DIR) / page.output).exists():
+            return False
+        return entry['fingerprint'] == self.fingerprint(page, store)[0]
+
+    def record(self, page, store):
+        fp, names = self.fingerprint(page, store)
+        self.pages[page.output] = {'fingerprint': fp, 'template': TEMPLATE_VERSION, 'sections': names}
+
+    def save(self):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        tmp.write_text(json.dumps(self.pages, indent=1, ensure_ascii=False))
+        os.replace(tmp, self.path)
+
+
+def _rewrite(dest, old, upto):
+    """Start a new version at `dest`, holding the first `upto` bytes of the
+    old version (which matched what we generated so far)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    out = open(dest, 'wb')
+    if old is not None:
+        old.seek(0)
+        while upto > 0:
+            block = old.read(min(upto, 1 << 16))
+            out.write(block)
+            upto -= len(block)
+    return out
+
+
+def write_page(rel_path, chunks, root=None, staging=None):
+    """Stream a page to disk — `chunks` is a string or an iterable of strings.
+
+    The new content is compared against the existing file as it streams, so
+    an unchanged page costs one read and no write. A changed page goes to
+    `staging`/rel_path when a staging directory is given (the caller commits
+    it), otherwise through a temp file renamed into place. Nothing holds the
+    whole document. Returns (written, bytes).
+    """
+    path = Path(root or DOCS_DIR) / rel_path
+    dest = Path(staging) / rel_path if staging else path.with_name(f'.{path.name}.tmp')
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    old = open(path, 'rb') if path.exists() else None
+    out = None
+    size = 0
+    try:
+        for chunk in chunks:
+            data = chunk.encode()
+            if out is None:
+                if old is not None and old.read(len(data)) == data:
+                    size += len(data)
+                    continue
+                out = _rewrite(dest, old, size)
+            out.write(data)
+            size += len(data)
+        if out is None:
+            if old is not None and not old.read(1):
+                return False, size
+            out = _rewrite(dest, old, size)
+        out.close()
+        if not staging:
+            os.replace(dest, path)
+        return True, size
+    except BaseException:
+        if out is not None:
+            out.close()
+            os.unlink(dest)
+        raise
+    finally:
+        if old is not None:
+            old.close()
+
+
+# ─── Page Registry ────────────────────────────────────────────────────────────
+
+# name: unique id · render: store → (text or list of chunks, summary) · output: path under
+# DOCS_DIR · inputs: SHIPLOG sections the page reads (None = all of them), or
+# a picklable callable store → JSON-able value the page depends on.
+Page = namedtuple('Page', 'name render output inputs')
+PageResult = namedtuple('PageResult', 'page status summary render_ms write_ms bytes')
+
+PAGES = []
+PAGE_SETS = []
+PAGE_SET_GLOBS = []
+
+
+def register_page(name, output, inputs=None):
+    """Decorator: add a renderer to the page registry."""
+    def wrap(render):
+        PAGES.append(Page(name, render, output, inputs))
+        return render
+    return wrap
+
+
+def register_pages(*globs):
+    """Decorator: add a page family — factory(store) → [Page] — whose
+    members depend on the data (one archive page per month, ...). `globs`
+    (git glob pathspecs under DOCS_DIR) cover every output it can write."""
+    def wrap(factory):
+        PAGE_SETS.append(factory)
+        PAGE_SET_GLOBS.extend(globs)
+        return factory
+    return wrap
+
+
+def all_pages(store):
+    pages = list(PAGES)
+    for factory in PAGE_SETS:
+        pages.extend(factory(store))
+    return pages
+
+
+def generated_globs():
+    """Glob pathspecs for everything a build owns under DOCS_DIR — pages,
+    page families, fingerprinted assets — with their compressed siblings.
+    Whatever they match is the generator's to commit, queued or not."""
+    globs = [page.output for page in PAGES] + PAGE_SET_GLOBS + [hashed_glob(name) for name in ASSETS.values()]
+    return globs + [g + ext for g in globs for ext in SIBLINGS]
+
+
+_SHARED = None  # the ShipStore being rendered, set once per build (or per worker process)
+
+
+def _init_worker(store, footer_mode, asset_urls, asset_stage):
+    global _SHARED, FOOTER_MODE, ASSET_URLS, ASSET_STAGE
+    _SHARED = store
+    FOOTER_MODE = footer_mode
+    ASSET_URLS = asset_urls
+    ASSET_STAGE = asset_stage
+
+
+def _build_page(page, root, staging):
+    t0 = time.perf_counter()
+    chunks, summary = page.render(_SHARED)
+    if ASSET_STAGE and page.output.endswith('.html'):
+        chunks = minify_html((chunks,) if isinstance(chunks, str) else chunks)
+    t1 = time.perf_counter()
+    written, size = write_page(page.output, chunks, root, staging)
+    t2 = time.perf_counter()
+    return PageResult(page, 'written' if written else 'unchanged', summary,
+                      (t1 - t0) * 1000, (t2 - t1) * 1000, size)
+
+
+def build_pages(store, pages=None, graph=None, root=None, jobs=None, processes=False, staging=None):
+    """Render and write pages concurrently from one shared, read-only ShipStore.
+
+    Pages the build graph reports as fresh are skipped; changed pages go to
+    the `staging` directory when one is given. Returns one PageResult per
+    page, in registry order.
+    """
+    global _SHARED
+    pages = all_pages(store) if pages is None else pages
+    stale = [p for p in pages if not (graph and graph.fresh(p, store, root))]
+    results = {p.name: PageResult(p, 'fresh', '', 0.0, 0.0, 0) for p in pages}
+
+    if stale:
+        if processes:
+            pool = ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(store, FOOTER_MODE, ASSET_URLS, ASSET_STAGE))
+        else:
+            _SHARED = store
+            pool = ThreadPoolExecutor(jobs or min(len(stale), (os.cpu_count() or 1) + 4))
+        with pool:
+            for res in pool.map(_build_page, stale, [root] * len(stale), [staging] * len(stale)):
+                results[res.page.name] = res
+                if graph:
+                    graph.record(res.page, store)
+
+    return [results[p.name] for p in pages]
 
 
 # ─── Generate Capabilities Page ───────────────────────────────────────────────
 
-def generate_capabilities(sections):
-    total = count_ships(sections)
-
-    # Group by category — covers ALL SHIPLOG sections
-    categories = {
-        'Security & Safety': {
-            'icon': '🛡️',
-            'desc': 'Defense-in-depth architecture. Kavach scam shield. Chetana deepfake detection. Fail-closed by default.',
-            'sections': ['Kavach', 'Kavach / Chetana', 'Kavach/Chetana'],
-        },
-        'Intelligence & Inference': {
-            'icon': '◈',
-            'desc': 'Multi-model orchestration with sovereign routing. Swarm intelligence. Research monitoring.',
-            'sections': ['MirrorSwarm Orchestration Engine', 'MirrorSwarm Terminal Spawner', 'Intelligence'],
-        },
-        'Memory & Identity': {
-            'icon': '⧉',
-            'desc': 'Persistent state across sessions. Memory lifecycle. Vault integrity. Continuity bus.',
-            'sections': ['Continuity System (this file)', 'Vault Organization'],
-        },
-        'Consumer Products': {
-            'icon': '⟡',
-            'desc': 'User-facing products built on sovereign infrastructure.',
-            'sections': ['ActiveMirror Site', 'Active Mirror Site', 'ActiveMirrorOS'],
-        },
-        'Infrastructure & Automation': {
-            'icon': '⚙',
-            'desc': 'Self-healing infrastructure. 24 managed services. Phone sync. Domain monitoring. Auto-backup.',
-            'sections': ['Factory Trigger', 'Cognitive Dashboard', 'Dashboard', 'INFRASTRUCTURE',
-                         'Infrastructure', 'MirrorDNA Infrastructure', 'Swarm Automation'],
-        },
-        'Publishing & Distribution': {
-            'icon': '📡',
-            'desc': 'Multi-platform publishing. Auto-synthesized beacon. 6 distribution channels.',
-            'sections': ['MirrorPublish', 'MirrorPublish Content', 'Beacon Auto-Publish', 'Publications', 'MirrorRadar'],
-        },
-        'Sovereign Factory': {
-            'icon': '🏭',
-            'desc': 'Multi-agent manufacturing pipeline. Voice-triggered. BenQ grid visualization.',
-            'sections': ['Sovereign Factory', 'Swarm Choreography Pattern'],
-        },
-    }
-
-    cards_html = ''
-    for cat_name, cat in categories.items():
-        items = []
-        for sec_name in cat['sections']:
-            if sec_name in sections:
-                items.extend(sections[sec_name]['items'])
-
-        if not items:
-            continue
-
-        cards = '\n'.join(capability_card(it['name'], it['desc']) for it in items[:12])  # cap at 12 per category
-
-        cards_html += f'''
-            <h2 id="{cat_name.lower().replace(' ', '-').replace('&', 'and')}">{cat['icon']} {cat_name}</h2>
-            <p>{cat['desc']}</p>
-            <p style="color: var(--text-muted); font-size: 0.85rem;">{len(items)} shipped capabilities</p>
-
-            <div class="capability-grid">
-{cards}
-            </div>
+SEARCH_BOX = '''
+            <input id="search" type="search" placeholder="Search every shipped capability…" autocomplete="off"
+                style="width: 100%; padding: 0.75rem 1rem; background: var(--bg-card); color: var(--text-primary); border: 1px solid var(--border-subtle); border-radius: 1rem; font-size: 1rem;">
+            <ul id="search-results" style="list-style: none; padding: 0;"></ul>
 '''
 
-    html = f'''{HEAD.format(title="System Capabilities — What MirrorDNA Can Do", desc=f"{total} shipped capabilities across security, intelligence, memory, infrastructure, and consumer products.")}
+# Queries search/: every query word is a prefix; results must match all of them
+SEARCH_LOADER = '''
+    <script>
+    (function () {
+        var input = document.getElementById('search'), list = document.getElementById('search-results');
+        var manifest = null, shards = {}, blocks = {}, ready = null;
+        if (!input) return;
+        function json(url) { return fetch(url).then(function (r) { return r.json(); }); }
+        function shard(key) {
+            if (!shards[key]) shards[key] = manifest.shards[key] ? json(manifest.shards[key].href) : Promise.resolve(null);
+            return shards[key];
+        }
+        function block(n) {
+            if (!blocks[n]) blocks[n] = json(manifest.docs.href + n + '.json').then(function (b) { return b.docs; });
+            return blocks[n];
+        }
+        function lookup(word) {
+            var c = word[0], key = /[a-z0-9]/.test(c) ? c : '_';
+            return shard(key).then(function (s) {
+                var ids = {};
+                if (!s) return ids;
+                var lo = 0, hi = s.tokens.length;
+                while (lo < hi) { var mid = (lo + hi) >> 1; if (s.tokens[mid] < word) lo = mid + 1; else hi = mid; }
+                for (var i = lo; i < s.tokens.length && s.tokens[i].lastIndexOf(word, 0) === 0; i++) {
+                    var id = 0;
+                    s.postings[i].forEach(function (gap) { id += gap; ids[id] = true; });
+                }
+                return ids;
+            });
+        }
+        function show(hits, rows) {
+            list.textContent = '';
+            hits.slice(0, 25).forEach(function (id, i) {
+                var d = rows[i], li = document.createElement('li'), s = document.createElement('strong');
+                li.style.margin = '0.5rem 0';
+                s.textContent = d[0];
+                li.appendChild(s);
+                li.appendChild(document.createTextNode(' (' + (d[3] || d[2]) + (d[4] !== 'unknown' ? ', ' + d[4] : '') + ') — ' + d[1]));
+                list.appendChild(li);
+            });
+            if (hits.length > 25) list.appendChild(document.createTextNode('...and ' + (hits.length - 25) + ' more'));
+        }
+        function newest(a, b) { return b - a; }  // ids run undated, then oldest to newest
+        function rows(hits) {
+            var size = manifest.docs.block;
+            return Promise.all(hits.slice(0, 25).map(function (id) {
+                return block(Math.floor(id / size)).then(function (docs) { return docs[id % size]; });
+            }));
+        }
+        function search() {
+            var q = input.value, words = (q.toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) || [])
+                .filter(function (w) { return w.length >= manifest.min_token; });
+            if (!words.length) { list.textContent = ''; return; }
+            Promise.all(words.map(lookup)).then(function (sets) {
+                var hits = Object.keys(sets[0]).map(Number).filter(function (id) {
+                    return sets.every(function (ids) { return ids[id]; });
+                }).sort(newest);
+                return rows(hits).then(function (docs) {
+                    if (input.value === q) show(hits, docs);
+                });
+            });
+        }
+        input.addEventListener('input', function () {
+            ready = ready || json('search/index.json').then(function (m) { manifest = m; });
+            ready.then(search);
+        });
+    })();
+    </script>'''
+
+
+@register_page('capabilities', 'capabilities/index.html')
+def render_capabilities(store):
+    total = store.stats['total']
+
+    out = [head(title="System Capabilities — What MirrorDNA Can Do", desc=f"{total} shipped capabilities across security, intelligence, memory, infrastructure, and consumer products."), f'''
 
 <body>
 {nav('capabilities')}
@@ -228,52 +1162,143 @@ def generate_capabilities(sections):
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Shipped</div>
                 </div>
                 <div style="text-align: center; padding: 1rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid var(--border-subtle);">
-                    <div style="font-size: 1.5rem; font-weight: 700; color: var(--accent-primary);">{len(categories)}</div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: var(--accent-primary);">{len(CATEGORIES)}</div>
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Layers</div>
                 </div>
                 <div style="text-align: center; padding: 1rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid var(--border-subtle);">
-                    <div style="font-size: 1.5rem; font-weight: 700; color: var(--accent-primary);">{len(sections)}</div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: var(--accent-primary);">{store.stats['sections']}</div>
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Systems</div>
                 </div>
             </div>
+{SEARCH_BOX}
+''']
 
-{cards_html}
-        </div>
-{footer()}'''
+    for cat_name, cat in CATEGORIES.items():
+        items = store.by_category[cat_name]
+        if not items:
+            continue
+        out.append(f'''
+            <h2 id="{cat_name.lower().replace(' ', '-').replace('&', 'and')}">{cat['icon']} {cat_name}</h2>
+            <p>{cat['desc']}</p>
+            <p style="color: var(--text-muted); font-size: 0.85rem;">{len(items)} shipped capabilities</p>
+
+            <div class="capability-grid">
+''')
+        out.extend(capability_cards(items[:12]))  # cap at 12 per category
+        out.append('''
+            </div>
+''')
 
-    (DOCS_DIR / 'capabilities' / 'index.html').write_text(html)
-    print(f'  ✓ capabilities/ — {total} capabilities across {len(categories)} categories')
+    out.append('''
+        </div>''')
+    out.append(SEARCH_LOADER)
+    out.append('\n')
+    out.append(footer(store))
+    return out, f'capabilities/ — {total} capabilities across {len(CATEGORIES)} categories'
 
 
 # ─── Generate Story/Timeline Page ─────────────────────────────────────────────
 
-def generate_story(sections):
-    dates = get_ship_dates(sections)
+# The story page shows only the most recent days; older days live in one
+# archive page per month (story/2025-04/) plus a compact days.json per month
+# that the story page loads on demand via story/index.json.
+STORY_RECENT_DAYS = 30
+STORY_ITEMS_PER_DAY = 8
+
+def story_cutoff(store):
+    """First day shown on the main story page (None if nothing is archived)."""
+    days = list(store.by_date)
+    return days[-STORY_RECENT_DAYS] if len(days) > STORY_RECENT_DAYS else None
+
 
-    timeline_html = ''
-    for d, items in reversed(list(dates.items())):
-        items_html = '\n'.join(
-            f'                    <li><strong>{it["name"]}</strong> ({it["section"]}) — {it["desc"][:100]}</li>'
-            for it in items[:8]  # cap per day
-        )
-        more = f' <li style="color: var(--text-muted);">...and {len(items)-8} more</li>' if len(items) > 8 else ''
+def archived_months(store):
+    """Months with at least one day older than the main page shows, newest first."""
+    cutoff = story_cutoff(store)
+    if cutoff is None:
+        return []
+    return [m for m in reversed(store.by_month) if next(iter(store.by_month[m])) < cutoff]
 
-        timeline_html += f'''
+
+TIMELINE_ITEM = Template('''
             <div class="timeline-item">
-                <div class="timeline-date">{d}</div>
+                <div class="timeline-date">{date}</div>
                 <div class="timeline-content">
-                    <p style="color: var(--text-muted); font-size: 0.85rem;">{len(items)} ships</p>
+                    <p style="color: var(--text-muted); font-size: 0.85rem;">{count} ships</p>
                     <ul style="list-style: none; padding: 0;">
-{items_html}{more}
+{items}{more}
                     </ul>
                 </div>
-            </div>'''
-
-    total = count_ships(sections)
-    first_date = min(dates.keys()) if dates else '2025-04'
-    last_date = max(dates.keys()) if dates else date.today().isoformat()
-
-    html = f'''{HEAD.format(title="Story — How MirrorDNA Got Here", desc="Timeline of MirrorDNA development from April 2025 to present.")}
+            </div>''')
+
+
+def timeline_item(d, items):
+    items_html = '\n'.join(
+        f'                    <li><strong>{it.name}</strong> ({it.section}) — {it.desc[:100]}</li>'
+        for it in items[:STORY_ITEMS_PER_DAY]  # cap per day
+    )
+    more = (f' <li style="color: var(--text-muted);">...and {len(items) - STORY_ITEMS_PER_DAY} more</li>'
+            if len(items) > STORY_ITEMS_PER_DAY else '')
+    return TIMELINE_ITEM.chunks(date=d, count=len(items), items=items_html, more=more)
+
+
+def timeline(days):
+    """Chunks for a run of timeline days, given (date, items) pairs."""
+    for d, items in days:
+        yield from timeline_item(d, items)
+
+
+# Appends archived months to the timeline, one per click, from story/<month>/days.json
+STORY_LOADER = '''
+    <script>
+    (function () {
+        var btn = document.getElementById('load-older'), months = null, shownFrom = '', next = 0;
+        if (!btn) return;
+        function li(text, strong, muted) {
+            var el = document.createElement('li');
+            if (muted) el.style.color = 'var(--text-muted)';
+            if (strong) { var s = document.createElement('strong'); s.textContent = strong; el.appendChild(s); }
+            el.appendChild(document.createTextNode(text));
+            return el;
+        }
+        function day(d) {
+            var item = document.createElement('div'); item.className = 'timeline-item';
+            item.innerHTML = '<div class="timeline-date"></div><div class="timeline-content">' +
+                '<p style="color: var(--text-muted); font-size: 0.85rem;"></p><ul style="list-style: none; padding: 0;"></ul></div>';
+            item.querySelector('.timeline-date').textContent = d[0];
+            item.querySelector('p').textContent = d[1] + ' ships';
+            var ul = item.querySelector('ul');
+            d[2].forEach(function (it) { ul.appendChild(li(' (' + it[1] + ') — ' + it[2], it[0])); });
+            if (d[1] > d[2].length) ul.appendChild(li('...and ' + (d[1] - d[2].length) + ' more', '', true));
+            return item;
+        }
+        function more() {
+            if (next >= months.length) { btn.remove(); return; }
+            var m = months[next++];
+            fetch(m.data).then(function (r) { return r.json(); }).then(function (data) {
+                var tl = document.querySelector('.timeline');
+                data.days.forEach(function (d) { if (d[0] < shownFrom) tl.appendChild(day(d)); });
+                if (next >= months.length) btn.remove(); else btn.textContent = 'Load ' + months[next].month + ' →';
+            });
+        }
+        btn.addEventListener('click', function () {
+            if (months) return more();
+            fetch('story/index.json').then(function (r) { return r.json(); })
+                .then(function (idx) { months = idx.months; shownFrom = idx.shown_from; more(); });
+        });
+    })();
+    </script>'''
+
+
+@register_page('story', 'story/index.html')
+def render_story(store):
+    dates = store.by_date
+    recent = list(dates.items())[-STORY_RECENT_DAYS:]
+    months = store.by_month
+    archive = archived_months(store)
+    total = store.stats['total']
+    last_date = store.stats['latest'] or date.today().isoformat()
+
+    out = [head(title="Story — How MirrorDNA Got Here", desc="Timeline of MirrorDNA development from April 2025 to present."), f'''
 
 <body>
 {nav('story')}
@@ -296,34 +1321,430 @@ def generate_story(sections):
             <p>Every line below is a shipped, running capability — not a plan or a prototype.</p>
 
             <div class="timeline">
-{timeline_html}
+''']
+    out.extend(timeline(reversed(recent)))
+    out.append('''
+            </div>
+''')
+
+    if archive:
+        out.append(f'''
+            <div style="text-align: center; margin: 2rem 0;">
+                <button id="load-older" style="cursor: pointer; padding: 0.6rem 1.2rem; background: var(--bg-card); color: var(--text-primary); border: 1px solid var(--border-subtle); border-radius: 1rem;">Load {archive[0]} →</button>
+            </div>
+
+            <h2 id="archive">Archive</h2>
+            <ul>
+''')
+        out.append('\n'.join(
+            f'                <li><a href="story/{m}/">{m}</a> — {sum(len(v) for v in months[m].values())} ships</li>'
+            for m in archive
+        ))
+        out.append('''
+            </ul>''')
+
+    out.append('''
+        </div>''')
+    if archive:
+        out.append(STORY_LOADER)
+    out.append('\n')
+    out.append(footer(store))
+    return out, f'story/ — {len(recent)} of {len(dates)} days, {total} ships, {len(archive)} archived months'
+
+
+@register_page('story-index', 'story/index.json')
+def render_story_index(store):
+    months = store.by_month
+    index = {'shown_from': story_cutoff(store), 'months': [
+        {
+            'month': m,
+            'days': len(months[m]),
+            'ships': sum(len(v) for v in months[m].values()),
+            'href': f'story/{m}/',
+            'data': f'story/{m}/days.json',
+        }
+        for m in archived_months(store)
+    ]}
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':')), f'story/index.json — {len(index["months"])} months'
+
+
+def month_inputs(month, store):
+    """What a month's archive depends on: that month's dated items, nothing else."""
+    return [[ship.key() for ship in ships] for ships in store.by_month.get(month, {}).values()]
+
+
+def render_story_month(month, store):
+    days = store.by_month.get(month, {})
+    ships = sum(len(v) for v in days.values())
+    latest = max(days) if days else None
+
+    out = [head(title=f"Story — {month} — MirrorDNA", desc=f"MirrorDNA ship timeline for {month}: {ships} capabilities shipped."), f'''
+
+<body>
+{nav('story')}
+
+    <main>
+        <div class="container">
+            <p class="subtitle"><a href="story/">Origin & Timeline</a> · Archive</p>
+            <h1>{month}</h1>
+
+            <p class="lead" style="color: var(--text-muted); font-size: 1rem;">
+                {ships} capabilities shipped across {len(days)} active days.
+            </p>
+
+            <div class="timeline">
+''']
+    out.extend(timeline(reversed(days.items())))
+    out.append('''
             </div>
         </div>
-{footer()}'''
+''')
+    out.append(footer(store, latest))
+    return out, f'story/{month}/ — {len(days)} days, {ships} ships'
+
+
+def render_story_month_data(month, store):
+    days = store.by_month.get(month, {})
+    data = {'month': month, 'days': [
+        [d, len(items), [[it.name, it.section, it.desc[:100]] for it in items[:STORY_ITEMS_PER_DAY]]]
+        for d, items in reversed(days.items())
+    ]}
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')), f'story/{month}/days.json'
+
+
+@register_pages('story/*/index.html', 'story/*/days.json')
+def story_archive_pages(store):
+    pages = []
+    for month in archived_months(store):
+        inputs = partial(month_inputs, month)
+        pages.append(Page(f'story:{month}', partial(render_story_month, month), f'story/{month}/index.html', inputs))
+        pages.append(Page(f'story:{month}:data', partial(render_story_month_data, month), f'story/{month}/days.json', inputs))
+    return pages
+
+
+# ─── Search Index ─────────────────────────────────────────────────────────────
+
+# A static, serverless search index written alongside the pages:
+#   search/index.json    — manifest: shard list, doc count, doc block size
+#   search/<c>.json      — tokens starting with <c>, sorted (prefix = binary
+#                          search), each with its gap-encoded postings
+#   search/docs/<n>.json — rows n·SEARCH_DOC_BLOCK onwards, one per ship; a
+#                          posting is a row number
+# Rows are numbered undated first, then oldest first, so a higher id is a
+# newer ship: the site orders hits by id alone, then fetches the manifest,
+# the shards the query touches and only the doc blocks of the hits it shows.
+# A new ship takes the next id, so it only touches the last doc block and its
+# own tokens' shards.
+SEARCH_TOKEN = re.compile(r'\w+')
+SEARCH_MIN_TOKEN = 2
+SEARCH_DESC_CHARS = 160
+SEARCH_FIELDS = ['name', 'desc', 'section', 'category', 'date']
+SEARCH_DOC_BLOCK = 1000
+
+
+def shard_key(token):
+    c = token[0]
+    return c if 'a' <= c <= 'z' or '0' <= c <= '9' else '_'
+
+
+class SearchIndex:
+    """Inverted token index over every ship in a store.
+
+    docs:   [name, desc, section, category, date] rows — undated ships, then
+            by date ascending, in log order within a date
+    shards: shard key → sorted [(token, [doc ids ascending])]
+    """
+
+    def __init__(self, store):
+        ships = [ship for ships in store.by_section.values() for ship in ships if ship.date == 'unknown']
+        ships += [ship for ships in store.by_date.values() for ship in ships]
+        self.docs = []
+        postings = {}
+        for doc_id, ship in enumerate(ships):
+            category = SECTION_CATEGORY.get(ship.section, '')
+            self.docs.append([ship.name, ship.desc[:SEARCH_DESC_CHARS], ship.section, category, ship.date])
+            text = f'{ship.name} {ship.desc} {ship.section} {category}'.lower()
+            for token in set(SEARCH_TOKEN.findall(text)):
+                if len(token) >= SEARCH_MIN_TOKEN:
+                    postings.setdefault(token, []).append(doc_id)
+        self.shards = {}
+        for token in sorted(postings):
+            self.shards.setdefault(shard_key(token), []).append((token, postings[token]))
+
+
+_SEARCH = (None, None)
+_SEARCH_LOCK = Lock()
+
+
+def search_index(store):
+    """The SearchIndex for `store`, built once and shared by every shard page."""
+    global _SEARCH
+    with _SEARCH_LOCK:
+        if _SEARCH[0] is not store:
+            _SEARCH = (store, SearchIndex(store))
+        return _SEARCH[1]
+
+
+def render_search_manifest(store):
+    index = search_index(store)
+    manifest = {
+        'docs': {'href': 'search/docs/', 'block': SEARCH_DOC_BLOCK, 'fields': SEARCH_FIELDS},
+        'count': len(index.docs),
+        'min_token': SEARCH_MIN_TOKEN,
+        'shards': {key: {'href': f'search/{key}.json', 'tokens': len(tokens)} for key, tokens in index.shards.items()},
+    }
+    return json.dumps(manifest, ensure_ascii=False, separators=(',', ':')), f'search/index.json — {len(index.docs)} docs, {len(index.shards)} shards'
+
+
+def render_search_docs(n, store):
+    docs = search_index(store).docs[n * SEARCH_DOC_BLOCK:(n + 1) * SEARCH_DOC_BLOCK]
+    return json.dumps({'docs': docs}, ensure_ascii=False, separators=(',', ':')), f'search/docs/{n}.json — {len(docs)} docs'
+
+
+def render_search_shard(key, store):
+    tokens = search_index(store).shards.get(key, [])
+    gaps = []
+    for _, ids in tokens:
+        prev = 0
+        row = []
+        for doc_id in ids:
+            row.append(doc_id - prev)
+            prev = doc_id
+        gaps.append(row)
+    shard = {'tokens': [token for token, _ in tokens], 'postings': gaps}
+    return json.dumps(shard, ensure_ascii=False, separators=(',', ':')), f'search/{key}.json — {len(tokens)} tokens'
+
+
+@register_pages('search/*.json', 'search/docs/*.json')
+def search_pages(store):
+    index = search_index(store)
+    pages = [Page('search:index', render_search_manifest, 'search/index.json', None)]
+    for n in range(-(-len(index.docs) // SEARCH_DOC_BLOCK)):
+        pages.append(Page(f'search:docs:{n}', partial(render_search_docs, n), f'search/docs/{n}.json', None))
+    for key in index.shards:
+        pages.append(Page(f'search:{key}', partial(render_search_shard, key), f'search/{key}.json', None))
+    return pages
+
+
+# ─── Feeds ────────────────────────────────────────────────────────────────────
+
+# feed.xml (Atom) and feed.json (JSON Feed) hold the newest FEED_ENTRIES ships.
+# Entries are appended, never recomputed: per section, the feed state
+# remembers the newest date it published and the ids (section, name, date)
+# of what it published in the FEED_LATE_DAYS before that. A ship becomes a
+# new entry unless its id is remembered or it is older than that window —
+# so a newly discovered repo log is fed in full, a backfilled ship is fed
+# late, and a reworded one is not fed twice. Entries pushed out of the feed
+# are rotated into numbered archive documents (RFC 5005 prev-archive chain):
+# feed/archive/1.xml is the oldest, and a full archive never changes again.
+FEED_STATE = CACHE_DIR / "feed_state.json"
+FEED_STATE_VERSION = 2
+FEED_ENTRIES = 50
+FEED_ARCHIVE_ENTRIES = 100
+FEED_LATE_DAYS = 90
+FEED_ID_CHARS = 16
+FEED_TITLE = 'MirrorDNA — Shipped'
+FEED_ID = 'tag:mirrordna-reflection-protocol.github.io,2025:MirrorDNA-Docs/feed'
+
+
+def feed_entry(ship):
+    digest = hashlib.sha256(json.dumps([ship.section, ship.name, ship.date], ensure_ascii=False).encode()).hexdigest()
+    return {'hash': digest, 'date': ship.date, 'name': ship.name, 'desc': ship.desc, 'section': ship.section}
+
+
+def feed_floor(day):
+    """Oldest date still tracked by id below a section's newest published `day`."""
+    try:
+        return (date.fromisoformat(day) - timedelta(days=FEED_LATE_DAYS)).isoformat()
+    except ValueError:  # not a calendar date: keep every id
+        return ''
+
+
+class FeedState:
+    """Published feed entries plus, per section, what has been published,
+    persisted between builds.
+
+    update() works out this build's new entries and rotation in memory;
+    save() persists them once the build's output has been committed.
+    """
+
+    def __init__(self, path=FEED_STATE):
+        self.path = Path(path) if path else None
+        self.published = {}          # section → {'date': newest published, 'ids': {id: date}}
+        self.entries = []            # current feed, oldest first
+        self.archive = 0             # number of the open (not yet full) archive
+        self.archive_entries = []    # its entries, oldest first
+        self.touched = {}            # archive number → entries, for archives this build changed
+        self.new = 0
+        if self.path and self.path.exists():
+            try:
+                state = json.loads(self.path.read_text())
+            except ValueError as e:
+                # Starting over would republish the whole history and overwrite feed/archive/
+                raise RuntimeError(f'{self.path}: unreadable feed state ({e}); restore or delete it') from e
+            if state.get('version') == FEED_STATE_VERSION:
+                self.published = state['published']
+                self.entries = state['entries']
+                self.archive = state['archive']
+                self.archive_entries = state['archive_entries']
+
+    def update(self, store):
+        """Append the store's ships that were not published yet."""
+        published = self.published
+        floors = {section: feed_floor(seen['date']) for section, seen in published.items()}
+        new = []
+        for d, ships in store.by_date.items():
+            for ship in ships:
+                floor = floors.get(ship.section)
+                if floor is not None and d < floor:
+                    continue  # older than the section's window: published long ago
+                entry = feed_entry(ship)
+                seen = published.get(ship.section)
+                if seen is None or entry['hash'][:FEED_ID_CHARS] not in seen['ids']:
+                    new.append(entry)
+        if not new:
+            return self
+        self.new = len(new)
+        for entry in new:
+            seen = published.setdefault(entry['section'], {'date': '', 'ids': {}})
+            seen['ids'][entry['hash'][:FEED_ID_CHARS]] = entry['date']
+            seen['date'] = max(seen['date'], entry['date'])
+        for section in {entry['section'] for entry in new}:
+            seen = published[section]
+            floor = feed_floor(seen['date'])
+            seen['ids'] = {i: d for i, d in seen['ids'].items() if d >= floor}
+
+        entries = self.entries + new
+        overflow, self.entries = entries[:-FEED_ENTRIES], entries[-FEED_ENTRIES:]
+        for entry in overflow:
+            if not self.archive or len(self.archive_entries) == FEED_ARCHIVE_ENTRIES:
+                self.archive += 1
+                self.archive_entries = []
+            self.archive_entries.append(entry)
+            self.touched[self.archive] = self.archive_entries
+        return self
+
+    def save(self):
+        if not self.path or not self.new:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        tmp.write_text(json.dumps({
+            'version': FEED_STATE_VERSION, 'published': self.published, 'entries': self.entries,
+            'archive': self.archive, 'archive_entries': self.archive_entries,
+        }, ensure_ascii=False))
+        os.replace(tmp, self.path)
+
+
+_FEED = (None, None)
+_FEED_LOCK = Lock()
+
+
+def feed_state(store):
+    """This build's FeedState, loaded and updated once per store."""
+    global _FEED
+    with _FEED_LOCK:
+        if _FEED[0] is not store:
+            _FEED = (store, FeedState().update(store))
+        return _FEED[1]
+
+
+def feed_document(n, store):
+    """(entries, prev archive number or None) of the current feed (n=0) or archive n."""
+    feed = feed_state(store)
+    if n == 0:
+        return feed.entries, feed.archive or None
+    return feed.touched[n], (n - 1) or None
+
+
+ATOM_ENTRY = Template('''
+  <entry>
+    <id>{id}</id>
+    <title>{title}</title>
+    <updated>{date}T00:00:00Z</updated>
+    <category term="{section}"/>
+    <link href="{url}"/>
+    <summary>{summary}</summary>
+  </entry>''')
+
+
+def render_atom(n, store):
+    entries, prev = feed_document(n, store)
+    self_url = 'feed.xml' if n == 0 else f'feed/archive/{n}.xml'
+    updated = entries[-1]['date'] if entries else store.latest or date.today().isoformat()
+    out = [f'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:fh="http://purl.org/syndication/history/1.0">
+  <id>{FEED_ID if n == 0 else f"{FEED_ID}/archive/{n}"}</id>
+  <title>{FEED_TITLE}</title>
+  <updated>{updated}T00:00:00Z</updated>
+  <author><name>Paul Desai</name></author>
+  <link rel="self" href="{SITE_URL}{self_url}"/>
+  <link rel="alternate" href="{SITE_URL}story/"/>''']
+    if n:
+        out.append(f'\n  <fh:archive/>\n  <link rel="current" href="{SITE_URL}feed.xml"/>')
+    if prev:
+        out.append(f'\n  <link rel="prev-archive" href="{SITE_URL}feed/archive/{prev}.xml"/>')
+    for entry in reversed(entries):
+        out.extend(ATOM_ENTRY.chunks(
+            id=f"{FEED_ID}:{entry['hash'][:FEED_ID_CHARS]}", title=xml_escape(entry['name']), date=entry['date'],
+            section=xml_escape(entry['section'], {'"': '&quot;'}), url=f'{SITE_URL}story/',
+            summary=xml_escape(entry['desc'])))
+    out.append('\n</feed>\n')
+    return out, f'{self_url} — {len(entries)} entries'
+
+
+def render_json_feed(n, store):
+    entries, prev = feed_document(n, store)
+    self_url = 'feed.json' if n == 0 else f'feed/archive/{n}.json'
+    feed = {
+        'version': 'https://jsonfeed.org/version/1.1',
+        'title': FEED_TITLE,
+        'home_page_url': f'{SITE_URL}story/',
+        'feed_url': f'{SITE_URL}{self_url}',
+        'authors': [{'name': 'Paul Desai'}],
+        'items': [{
+            'id': f"{FEED_ID}:{entry['hash'][:FEED_ID_CHARS]}",
+            'url': f'{SITE_URL}story/',
+            'title': entry['name'],
+            'content_text': entry['desc'],
+            'date_published': f"{entry['date']}T00:00:00Z",
+            'tags': [entry['section']],
+        } for entry in reversed(entries)],
+    }
+    if prev:
+        feed['_archive'] = {'prev': f'{SITE_URL}feed/archive/{prev}.json'}
+    return json.dumps(feed, ensure_ascii=False, indent=1), f'{self_url} — {len(entries)} entries'
 
-    (DOCS_DIR / 'story' / 'index.html').write_text(html)
-    print(f'  ✓ story/ — {len(dates)} days, {total} ships')
 
+def feed_inputs(n, store):
+    entries, prev = feed_document(n, store)
+    return {'entries': [e['hash'] for e in entries], 'prev': prev}
 
-# ─── Generate Security Page ──────────────────────────────────────────────────
 
-def generate_security(sections):
-    kavach_items = []
-    for key in ['Kavach', 'Kavach / Chetana', 'Kavach/Chetana']:
-        if key in sections:
-            kavach_items.extend(sections[key]['items'])
+@register_pages('feed.xml', 'feed.json', 'feed/archive/*.xml', 'feed/archive/*.json')
+def feed_pages(store):
+    """feed.xml / feed.json, plus the archives this build added entries to."""
+    pages = []
+    for n in [0] + sorted(feed_state(store).touched):
+        stem = 'feed' if n == 0 else f'feed/archive/{n}'
+        inputs = partial(feed_inputs, n)
+        pages.append(Page(f'feed:{n}:atom', partial(render_atom, n), f'{stem}.xml', inputs))
+        pages.append(Page(f'feed:{n}:json', partial(render_json_feed, n), f'{stem}.json', inputs))
+    return pages
 
-    kavach_cards = '\n'.join(capability_card(it['name'], it['desc'], '⛨') for it in kavach_items)
 
-    # Infrastructure security
-    infra_items = []
-    for key in ['Infrastructure', 'MirrorDNA Infrastructure']:
-        if key in sections:
-            infra_items.extend([it for it in sections[key]['items'] if any(w in it['name'].lower() for w in ['security', 'audit', 'snapshot', 'dns', 'heal'])])
+# ─── Generate Security Page ──────────────────────────────────────────────────
+
+@register_page('security', 'security/index.html', inputs=KAVACH_SECTIONS + INFRA_SECTIONS)
+def render_security(store):
+    kavach_items = store.by_category['Security & Safety']
+    lines = f"{store.stats['control_plane_lines']:,}"
 
-    infra_cards = '\n'.join(capability_card(it['name'], it['desc'], '🔒') for it in infra_items)
+    # Infrastructure security
+    infra_items = [it for it in store.items_in(INFRA_SECTIONS)
+                   if any(w in it.name.lower() for w in ['security', 'audit', 'snapshot', 'dns', 'heal'])]
 
-    html = f'''{HEAD.format(title="Security Architecture — MirrorDNA", desc="Defense-in-depth security: AMGL Guard, MirrorGate, Kavach AI Shield, red-team testing.")}
+    out = [head(title="Security Architecture — MirrorDNA", desc="Defense-in-depth security: AMGL Guard, MirrorGate, Kavach AI Shield, red-team testing."), f'''
 
 <body>
 {nav('security')}
@@ -347,7 +1768,7 @@ def generate_security(sections):
                     <div style="font-size: 0.8rem; color: var(--text-muted);">Guard Rules</div>
                 </div>
                 <div style="text-align: center; padding: 1.5rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid rgba(16,185,129,0.2);">
-                    <div style="font-size: 2rem; font-weight: 700; color: var(--accent-success);">12,096</div>
+                    <div style="font-size: 2rem; font-weight: 700; color: var(--accent-success);">{lines}</div>
                     <div style="font-size: 0.8rem; color: var(--text-muted);">Lines in Control Plane</div>
                 </div>
                 <div style="text-align: center; padding: 1.5rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid rgba(245,158,11,0.2);">
@@ -363,33 +1784,46 @@ def generate_security(sections):
             <p>Consumer-facing scam detection and digital safety for India. {len(kavach_items)} shipped capabilities including deepfake detection, voice clone analysis, QR code scanning, and SMS auto-scanning.</p>
 
             <div class="capability-grid">
-{kavach_cards}
+''']
+    out.extend(capability_cards(kavach_items, '⛨'))
+    out.append('''
             </div>
 
             <h2 id="infrastructure-security">🔐 Infrastructure Security</h2>
             <p>System-level security hardening, monitoring, and self-healing.</p>
 
             <div class="capability-grid">
-{infra_cards}
+''')
+    out.extend(capability_cards(infra_items, '🔒'))
+    out.append('''
             </div>
 
             <h2 id="red-team">🎯 Red-Team Testing</h2>
             <p>175 attacks tested across 5 categories (December 2025). Prompt exfiltration, role injection, meta-instruction, social engineering, jailbreak patterns. Vulnerabilities found, patched, verified.</p>
         </div>
-{footer()}'''
-
-    (DOCS_DIR / 'security' / 'index.html').write_text(html)
-    print(f'  ✓ security/ — AMGL + MirrorGate + {len(kavach_items)} Kavach capabilities')
+''')
+    out.append(footer(store))
+    return out, f'security/ — AMGL + MirrorGate + {len(kavach_items)} Kavach capabilities'
 
 
 # ─── Generate Homepage ────────────────────────────────────────────────────────
 
-def generate_homepage(sections):
-    total = count_ships(sections)
-    dates = get_ship_dates(sections)
-    latest = max(dates.keys()) if dates else date.today().isoformat()
+HOMEPAGE_STATS = ('total', 'latest', 'months', 'repos', 'public', 'layers', 'control_plane_lines')
+
 
-    html = f'''{HEAD.format(title="MirrorDNA — Sovereign AI Infrastructure", desc=f"Sovereign AI infrastructure. {total} shipped capabilities. 95 repos. 9 layers. Built by one person.")}
+def homepage_inputs(store):
+    return {name: store.stats[name] for name in HOMEPAGE_STATS}
+
+
+@register_page('homepage', 'index.html', inputs=homepage_inputs)
+def render_homepage(store):
+    stats = store.stats
+    total = stats['total']
+    latest = stats['latest'] or date.today().isoformat()
+    repos, public, layers = stats['repos'], stats['public'], stats['layers']
+    lines = f"{stats['control_plane_lines']:,}"
+
+    out = [head(title="MirrorDNA — Sovereign AI Infrastructure", desc=f"Sovereign AI infrastructure. {total} shipped capabilities. {repos} repos. {layers} layers. Built by one person."), f'''
 
 <body>
 {nav()}
@@ -404,17 +1838,17 @@ def generate_homepage(sections):
                     orchestrated AI?
                 </p>
                 <p class="lead" style="color: var(--text-muted); font-size: 1rem;">
-                    95 repositories. 9 architectural layers. {total} shipped capabilities. One person. No funding. Running in production.
+                    {repos} repositories. {layers} architectural layers. {total} shipped capabilities. One person. No funding. Running in production.
                 </p>
             </div>
 
             <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(140px, 1fr)); gap: 1rem; margin: 2rem 0;">
                 <div style="text-align: center; padding: 1.25rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid var(--border-subtle);">
-                    <div style="font-size: 1.75rem; font-weight: 700; color: var(--accent-primary);">95</div>
+                    <div style="font-size: 1.75rem; font-weight: 700; color: var(--accent-primary);">{repos}</div>
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Repos</div>
                 </div>
                 <div style="text-align: center; padding: 1.25rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid var(--border-subtle);">
-                    <div style="font-size: 1.75rem; font-weight: 700; color: var(--accent-primary);">9</div>
+                    <div style="font-size: 1.75rem; font-weight: 700; color: var(--accent-primary);">{layers}</div>
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Layers</div>
                 </div>
                 <div style="text-align: center; padding: 1.25rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid var(--border-subtle);">
@@ -422,7 +1856,7 @@ def generate_homepage(sections):
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Shipped</div>
                 </div>
                 <div style="text-align: center; padding: 1.25rem; background: var(--bg-card); border-radius: 1rem; border: 1px solid var(--border-subtle);">
-                    <div style="font-size: 1.75rem; font-weight: 700; color: var(--accent-success);">63</div>
+                    <div style="font-size: 1.75rem; font-weight: 700; color: var(--accent-success);">{public}</div>
                     <div style="font-size: 0.75rem; color: var(--text-muted);">Public</div>
                 </div>
             </div>
@@ -450,17 +1884,17 @@ def generate_homepage(sections):
                 <a href="architecture/" style="text-decoration: none;">
                     <div class="capability-card" style="cursor: pointer;">
                         <div class="capability-header"><span class="capability-icon">⧉</span><h4>ActiveMirrorOS</h4></div>
-                        <p>Control plane — 12,096 lines. Identity kernel, AMGL guard, vault lineage, consent ledger.</p>
+                        <p>Control plane — {lines} lines. Identity kernel, AMGL guard, vault lineage, consent ledger.</p>
                     </div>
                 </a>
             </div>
 
             <h2>Explore</h2>
             <div class="capability-grid">
-                <a href="story/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Story →</h4><p>10 months. How it all started.</p></div></a>
+                <a href="story/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Story →</h4><p>{stats['months']} months. How it all started.</p></div></a>
                 <a href="principles/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Principles →</h4><p>Truth-State Law. Zero Drift. Vault Supremacy.</p></div></a>
                 <a href="security/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Security →</h4><p>AMGL Guard. MirrorGate. Red-team tested.</p></div></a>
-                <a href="ecosystem/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Ecosystem →</h4><p>Interactive map of 95 repositories.</p></div></a>
+                <a href="ecosystem/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Ecosystem →</h4><p>Interactive map of {repos} repositories.</p></div></a>
                 <a href="research/" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer;"><h4>Research →</h4><p>SCD Protocol. Published papers.</p></div></a>
                 <a href="https://activemirror.ai" style="text-decoration: none;"><div class="capability-card" style="cursor: pointer; border-color: rgba(168,85,247,0.3);"><h4>activemirror.ai →</h4><p>Try the live system.</p></div></a>
             </div>
@@ -469,36 +1903,271 @@ def generate_homepage(sections):
                 Last updated: {latest} · Auto-generated from SHIPLOG
             </p>
         </div>
-{footer()}'''
+''', footer(store)]
+    return out, f'index.html — {total} ships, latest {latest}'
+
+
+# ─── Text Targets: Docusaurus markdown + llms.txt ─────────────────────────────
+
+# Same parse, same registry: these are pages like any other, just not HTML.
+# The Docusaurus page sits next to the hand-written status pages. llms.txt is
+# hand-written: only the block between its shipped markers comes from the logs,
+# and the rest of the file, edits included, is carried over as it stands.
+SITE_URL = 'https://mirrordna-reflection-protocol.github.io/MirrorDNA-Docs/'
+MD_RECENT_PER_CATEGORY = 10
+LLMS_RECENT = 10
+LLMS_BEGIN, LLMS_END = '<!-- shipped:begin -->', '<!-- shipped:end -->'
+MD_SPECIAL = re.compile(r'([\\`*_\[\]<>{}|#])')
+
+
+def md_escape(text):
+    """Escape text for a Docusaurus (MDX) markdown page."""
+    return MD_SPECIAL.sub(r'\\\1', text)
+
+
+def recent(ships, n):
+    """The n most recent ships, newest first (undated ones sort last)."""
+    return sorted(ships, key=lambda ship: '' if ship.date == 'unknown' else ship.date, reverse=True)[:n]
+
 
-    (DOCS_DIR / 'index.html').write_text(html)
-    print(f'  ✓ index.html — {total} ships, latest {latest}')
+@register_page('docusaurus-shiplog', 'website/docs/status/shiplog.md')
+def render_docusaurus_shiplog(store):
+    total = store.stats['total']
+    out = [f'''---
+sidebar_position: 3
+title: Shipped Capabilities
+---
 
+# Shipped Capabilities
+
+**{total} shipped capabilities** across {len(CATEGORIES)} layers, read from the ship logs. Latest ship: {store.stats['latest'] or 'unknown'}.
+
+| Layer | Shipped | Latest ship |
+|---|---:|---|
+''']
+    for cat_name, items in store.by_category.items():
+        last = max((ship.date for ship in items if ship.date != 'unknown'), default='—')
+        out.append(f'| {md_escape(cat_name)} | {len(items)} | {last} |\n')
+
+    for cat_name, cat in CATEGORIES.items():
+        items = store.by_category[cat_name]
+        if not items:
+            continue
+        out.append(f'\n## {md_escape(cat_name)}\n\n{md_escape(cat["desc"])}\n\n')
+        for ship in recent(items, MD_RECENT_PER_CATEGORY):
+            when = f' ({ship.date})' if ship.date != 'unknown' else ''
+            out.append(f'- **{md_escape(ship.name)}**{when} — {md_escape(ship.desc)}\n')
+        if len(items) > MD_RECENT_PER_CATEGORY:
+            out.append(f'- …and {len(items) - MD_RECENT_PER_CATEGORY} more\n')
+
+    out.append(f'''
+---
+
+*Generated from SHIPLOG.md by `scripts/generate_docs.py` — edits here are overwritten. Full list: [capabilities]({SITE_URL}capabilities/).*
+''')
+    return out, f'website/docs/status/shiplog.md — {total} ships'
+
+
+def llms_template(path=None):
+    """llms.txt as it stands, split around its shipped block: (before, after).
+
+    A file without a complete block keeps all its text and gets the block
+    appended; a missing file is just the block.
+    """
+    try:
+        text = Path(path or DOCS_DIR / 'llms.txt').read_text()
+    except OSError:
+        return '', '\n'
+    begin = text.rfind(LLMS_BEGIN)
+    end = text.find(LLMS_END, begin) if begin >= 0 else -1
+    if end < 0:
+        return text.rstrip('\n') + '\n\n', '\n'
+    return text[:begin], text[end + len(LLMS_END):]
+
+
+@register_page('llms', 'llms.txt')
+def render_llms(store):
+    total = store.stats['total']
+    before, after = llms_template()
+    out = [before, LLMS_BEGIN, f'''
+## Shipped
+{total} shipped capabilities across {len(CATEGORIES)} layers (latest ship: {store.stats['latest'] or 'unknown'}).
+''']
+    out.extend(f'- {cat_name}: {len(items)}\n' for cat_name, items in store.by_category.items() if items)
+    out.append('\n## Recently shipped\n')
+    dated = [ship for ships in store.by_date.values() for ship in ships]
+    out.extend(f'- {ship.name} ({ship.date}): {ship.desc}\n' for ship in recent(dated, LLMS_RECENT))
+    out += [LLMS_END, after]
+    return out, f'llms.txt — {total} ships'
 
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
-def main():
+def generate(full=False, jobs=None, processes=False, metrics=None, parser=None, graph=None, requested=None,
+             from_db=False):
+    """Parse the ship logs and build every registered page. Returns PageResults.
+
+    Long-running callers pass their own `parser` and `graph` so the parse
+    state and build fingerprints stay warm in memory between builds. With
+    `from_db` the ships come from the SQLite ship store instead of the logs.
+
+    Builds of one docs tree are serialised by its build lock, and all output
+    is staged and committed at once. A build that had to wait — and finds a
+    build triggered after `requested` (default: now) already finished — is
+    coalesced into that one and returns no results.
+    """
+    metrics = metrics or Metrics()
     print('⟡ MirrorDNA Doc Generator')
     print(f'  Reading: {SHIPLOG}')
 
     if not SHIPLOG.exists():
         print('  ERROR: SHIPLOG.md not found')
-        return
-
-    sections = parse_shiplog()
-    total = count_ships(sections)
-    print(f'  Parsed: {len(sections)} sections, {total} capabilities')
+        return None
+
+    with BuildLock(DOCS_DIR, requested) as lock:
+        if lock.covered:
+            print('  Coalesced: a build triggered after this one has already finished')
+            return []
+        graph = graph or BuildGraph()
+        recorded = dict(graph.pages)
+        staging = Staging(DOCS_DIR)
+        try:
+            results = _generate(full, jobs, processes, metrics, parser, graph, staging, from_db)
+        except BaseException:
+            staging.abort()
+            graph.pages = recorded  # a warm graph must not vouch for pages that never went live
+            raise
+        lock.completed()
+    return results
+
+
+def _generate(full, jobs, processes, metrics, parser, graph, staging, from_db=False):
+    global ASSET_URLS
+    sources = discover_sources()
+    for source in sources[1:]:
+        print(f'        + {source.path}')
+    if full:
+        for source in sources:
+            if source.checkpoint.exists():
+                source.checkpoint.unlink()
+    db = ShipDB()
+    try:
+        if from_db and not full and db.has(source.name for source in sources):
+            with metrics.phase('load', sources=len(sources)):
+                parsed = [db.sections(source.name) for source in sources]
+            print('  Loaded: ship store (logs not read)')
+        else:
+            with metrics.phase('parse', sources=len(sources)) as rec:
+                parsed = parse_sources(sources, jobs, processes, {'shiplog': parser} if parser else None)
+                rec['bytes'] = sum(source.path.stat().st_size for source in sources)
+            # Keep the SQLite ship store in step: only appended rows are written
+            with metrics.phase('store') as rec:
+                inserted, deleted = db.sync_all(sources, parsed)
+                rec['rows'] = inserted + deleted
+            if inserted or deleted:
+                print(f'  Store: +{inserted} −{deleted} rows ({db.path.name})')
+    finally:
+        db.close()
+    with metrics.phase('index'):
+        store = ShipStore(*parsed)
+    print(f'  Parsed: {len(store)} sections, {store.total} capabilities from {len(sources)} logs')
+
+    # Headline numbers: persisted counters, advanced by what this parse added
+    with metrics.phase('aggregates'):
+        aggregates = Aggregates(fresh=full).update_parsed(sources, parsed)
+        stats = aggregates.stats(repo_stats())
+        if (stats['total'], stats['sections']) != (store.total, len(store)):
+            print('  Aggregates out of step with the logs — recounting')
+            aggregates = Aggregates(fresh=True).update_parsed(sources, parsed)
+            stats = aggregates.stats(repo_stats())
+        aggregates.save()
+    store.stats = stats
+    print(f"  Stats: {stats['active_days']} active days, {stats['last_30']} ships in the last 30"
+          + (f" (recounted: {', '.join(aggregates.rebuilt)})" if aggregates.rebuilt else ''))
     print()
 
-    # Generate pages
-    generate_homepage(sections)
-    generate_capabilities(sections)
-    generate_story(sections)
-    generate_security(sections)
-
-    print(f'\n⟡ Done — {4} pages updated')
-    print(f'  Deploy: cd {DOCS_DIR} && git add -A && git commit -m "doc-gen: {date.today()}" && git push')
-
+    # Fingerprint styles/favicon first: page HEADs link the hashed names
+    assets = []
+    if ASSET_STAGE:
+        with metrics.phase('assets') as rec:
+            ASSET_URLS, changes = fingerprint_assets(DOCS_DIR, staging.dir)
+            for rel, status, summary in changes:
+                assets.append(PageResult(Page(f'asset:{rel}', None, rel, None), status, summary, 0.0, 0.0, 0))
+                if status == 'removed':
+                    staging.remove(rel)
+            rec['bytes'] = sum((staging.dir / rel).stat().st_size for rel, status, _ in changes if status == 'written')
+        for res in assets:
+            print(f"  {ASSET_MARKS[res.status]} {res.summary}")
+    else:
+        ASSET_URLS = dict(ASSETS)
+
+    # Render pages concurrently — skip any whose inputs are unchanged since the last build
+    if full:
+        graph.pages = {}
+    with metrics.phase('pages') as pages:
+        results = build_pages(store, graph=graph, jobs=jobs, processes=processes, staging=staging.dir)
+        pages['bytes'] = sum(res.bytes for res in results if res.status == 'written')
+
+    for res in results:
+        if res.status == 'fresh':
+            print(f'  · {res.page.output} — unchanged inputs, skipped')
+            continue
+        mark = '✓' if res.status == 'written' else '='
+        print(f'  {mark} {res.summary} ({res.render_ms:.1f} ms render, {res.write_ms:.1f} ms write)')
+        metrics.record(f'render:{res.page.name}', res.render_ms, bytes=res.bytes)
+        metrics.record(f'write:{res.page.name}', res.write_ms, bytes=res.bytes if res.status == 'written' else 0)
+
+    # Precompressed siblings for every output whose content changed (or that lacks them)
+    compressed = []
+    if ASSET_STAGE:
+        outputs = [res.page.output for res in assets + results if res.status != 'removed']
+        changed = {res.page.output for res in assets + results if res.status == 'written'}
+        with metrics.phase('compress') as rec:
+            for rel, raw, packed in precompress(DOCS_DIR, outputs, changed, staging.dir):
+                compressed.append(PageResult(Page(f'compress:{rel}', None, rel, None), 'written',
+                                             f'{rel} — {raw:,} → {packed:,} bytes', 0.0, 0.0, packed))
+            rec['bytes'] = sum(res.bytes for res in compressed)
+        if compressed:
+            print(f'  ✓ Precompressed: {len(compressed)} files, {rec["bytes"]:,} bytes ({rec["ms"]:.0f} ms)')
+
+    # Everything goes live at once; the graph only remembers committed pages
+    with metrics.phase('commit') as rec:
+        rec['files'] = len(staging.commit())
+    graph.save()
+    feed_state(store).save()
+
+    built = sum(res.status == 'written' for res in results)
+    print(f'\n⟡ Done — {built} of {len(results)} pages updated in {pages["ms"]:.0f} ms')
+    return assets + results + compressed
+
+
+def main(argv=None):
+    global FOOTER_MODE, ASSET_STAGE
+    ap = argparse.ArgumentParser(description='Generate MirrorDNA-Docs pages from SHIPLOG.md')
+    ap.add_argument('--full', action='store_true', help='ignore the parser checkpoints and re-parse every log from the top')
+    ap.add_argument('--footer', choices=['stable', 'today'], default=FOOTER_MODE,
+                    help="footer stamp: latest ship date (stable, default) or today's date")
+    ap.add_argument('--jobs', type=int, default=None, help='render workers (default: one per page)')
+    ap.add_argument('--processes', action='store_true', help='render in a process pool instead of threads')
+    ap.add_argument('--from-db', action='store_true',
+                    help='render from the SQLite ship store (doc_store.py) instead of parsing the logs')
+    ap.add_argument('--no-assets', action='store_true',
+                    help='skip the asset stage: no HTML minifying, hashed asset names or .gz/.br siblings')
+    ap.add_argument('--metrics', type=Path, help='write per-phase timings/memory as JSON to this file')
+    ap.add_argument('--profile', action='store_true', help='also dump cProfile + tracemalloc data per phase')
+    args = ap.parse_args(argv)
+    FOOTER_MODE = args.footer
+    ASSET_STAGE = not args.no_assets
+
+    metrics = Metrics(profile=args.profile)
+    results = generate(args.full, args.jobs, args.processes, metrics, from_db=args.from_db)
+    if args.metrics:
+        args.metrics.parent.mkdir(parents=True, exist_ok=True)
+        args.metrics.write_text(json.dumps(metrics.as_dict(), indent=1))
+    if results is None:
+        return 1
+    if any(res.status == 'written' for res in results):
+        print(f'  Deploy: cd {DOCS_DIR} && git add -A && git commit -m "doc-gen: {date.today()}" && git push')
+    return 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+⟡ MirrorDNA Parser Parity — generate_docs.py's SHIPLOG parser against the original.
+
+reference_parse() is the line-by-line parser generate_docs.py shipped with
+before the compiled tokenizer, frozen here. Every PARITY_CASES input (CRLF,
+stray `**`, malformed and bare `SHIPPED` tags, …) must parse the same, both
+from scratch and resumed from a checkpoint taken after any line.
+bench_docs.py imports both to check its synthetic logs too.
+
+Run:  python3 -m pytest -q scripts
+"""
+
+import re
+
+import generate_docs as gen
+
+
+def reference_parse(text):
+    """The original parser. `text` is as Path.read_text() returns it
+    (newlines normalised)."""
+    sections = {}
+    current_section = None
+    current_module = None
+    items = []
+
+    for line in text.split('\n'):
+        if line.startswith('## '):
+            if current_section and items:
+                sections[current_section] = {'module': current_module, 'items': items}
+            current_section = line[3:].strip()
+            current_module = None
+            items = []
+        elif line.startswith('> Module:'):
+            current_module = line.split('`')[1] if '`' in line else line
+        elif line.startswith('- **'):
+            m = re.match(r'- \*\*(.+?)\*\*\s*(?:\([^)]*\))?\s*[—:]\s*(.+?)(?:\s*`SHIPPED (\d{4}-\d{2}-\d{2})`)?$', line)
+            if m:
+                items.append({
+                    'name': m.group(1),
+                    'desc': m.group(2).strip().rstrip('`').strip(),
+                    'date': m.group(3) or 'unknown',
+                })
+        elif line.startswith('- Location:') or line.startswith('- Spec:') or line.startswith('- SHIPPED:'):
+            if items and line.startswith('- SHIPPED:'):
+                d = re.search(r'(\d{4}-\d{2}-\d{2})', line)
+                if d and items[-1]['date'] == 'unknown':
+                    items[-1]['date'] = d.group(1)
+
+    if current_section and items:
+        sections[current_section] = {'module': current_module, 'items': items}
+    return sections
+
+
+# Inputs the synthetic benchmark logs never produce
+PARITY_CASES = {
+    'crlf': '## A\r\n> Module: `~/repos/a`\r\n- **X** — y `SHIPPED 2026-01-01`\r\n- **Z**: w\r\n- SHIPPED: 2026-01-02\r\n',
+    'lone_cr': '## A\r- **X** — y\r- **Y** — z `SHIPPED 2026-01-01`\r',
+    'stray_stars': ('## A\n- **X** has **bold** — desc `SHIPPED 2026-01-01`\n- **Y** — a **b** c\n'
+                    '- ** — nothing\n- **** — empty\n- **unclosed — d\n'),
+    'malformed_tags': ('## A\n- **X** — d `SHIPPED 2026-1-01`\n- **Y** — d `SHIPPED 2026-01-01\n'
+                       '- **Z** — d SHIPPED 2026-01-01`\n- **W** — d `SHIPPED  2026-01-01`\n'
+                       '- **V** — d `SHIPPED 2026-01-01` trailing\n- **U** — d `shipped 2026-01-01`\n'
+                       '- **T** — d `SHIPPED 2026-02-30`\n'),
+    'bare_tag': '## A\n- **X** — `SHIPPED 2026-01-01`\n- **Y** —  `SHIPPED 2026-01-02`\n- **Z** — `SHIPPED 2026-01-03` \n',
+    'parens': '## A\n- **X** (beta) — d\n- **Y** (a)(b) — d\n- **Z** (unclosed — d\n- **Q**(x): d `SHIPPED 2026-02-02`\n',
+    'metadata': ('## A\n- **X** — d\n- Location: `x`\n- Spec: y\n- SHIPPED: on 2026-01-05 (late)\n'
+                 '- SHIPPED: 2026-01-06\n- **Y** — e `SHIPPED 2026-01-07`\n- SHIPPED: 2026-01-08\n'),
+    'headings': '## A\n- **X** — d\n## B\n- **Y** — e\n## A\n- **Z** — f\n## Empty\n\n##NoSpace\n- **W** — g\n',
+    'no_section': '- **X** — d\n## A\n- **Y** — e\n',
+    'unicode': '## Kavach / Chetana\n- **Ω** — “quoted” — dash `SHIPPED 2026-03-01`\n',
+    'no_final_newline': '## A\n- **X** — d `SHIPPED 2026-01-01`',
+}
+
+
+def line_ends(data):
+    """Byte offsets just past every \\r or \\n — where a checkpoint can fall."""
+    return [i + 1 for i, byte in enumerate(data) if byte in b'\r\n']
+
+
+# Plain loops rather than parametrize: bench_docs.py imports this module
+# and must not need pytest
+
+def test_full_parse(tmp_path):
+    shiplog = tmp_path / 'SHIPLOG.md'
+    for name, text in PARITY_CASES.items():
+        shiplog.write_bytes(text.encode())
+        assert dict(gen.parse_shiplog(shiplog, None)) == reference_parse(shiplog.read_text()), name
+
+
+def test_resumed_parse(tmp_path):
+    shiplog, checkpoint = tmp_path / 'SHIPLOG.md', tmp_path / 'checkpoint.json'
+    for name, text in PARITY_CASES.items():
+        data = text.encode()
+        shiplog.write_bytes(data)
+        expected = reference_parse(shiplog.read_text())
+        for cut in line_ends(data):
+            checkpoint.unlink(missing_ok=True)
+            shiplog.write_bytes(data[:cut])
+            gen.parse_shiplog(shiplog, checkpoint)
+            shiplog.write_bytes(data)
+            assert dict(gen.parse_shiplog(shiplog, checkpoint)) == expected, f'{name}: checkpoint at byte {cut}'
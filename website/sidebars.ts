@@ -21,6 +21,7 @@ const sidebars: SidebarsConfig = {
         'vault-manager/index',
         'status/index',
         'status/components',
+        'status/shiplog',
       ],
     },
     {